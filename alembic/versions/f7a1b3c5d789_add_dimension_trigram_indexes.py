@@ -0,0 +1,55 @@
+"""add_dimension_trigram_indexes
+
+Revision ID: f7a1b3c5d789
+Revises: d6e0f2g3h456
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a1b3c5d789"
+down_revision: str | None = "d6e0f2g3h456"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, column) for every trigram-searched dimension column
+_TRGM_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("ix_store_code_trgm", "store", "code"),
+    ("ix_store_name_trgm", "store", "name"),
+    ("ix_product_sku_trgm", "product", "sku"),
+    ("ix_product_name_trgm", "product", "name"),
+)
+
+
+def upgrade() -> None:
+    """Apply migration - add pg_trgm GIN indexes for dimension search.
+
+    The dimensions endpoints search with ILIKE '%pattern%', which cannot use
+    a btree index. pg_trgm GIN indexes let Postgres accelerate these scans
+    without any change to the queries.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for index_name, table_name, column_name in _TRGM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Revert migration - drop dimension trigram indexes."""
+    for index_name, table_name, _ in reversed(_TRGM_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
+
+    # Note: We don't drop the pg_trgm extension as it might be used elsewhere
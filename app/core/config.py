@@ -47,6 +47,7 @@ class Settings(BaseSettings):
     forecast_max_horizon: int = 90
     forecast_model_artifacts_dir: str = "./artifacts/models"
     forecast_enable_lightgbm: bool = False
+    forecast_model_cache_size: int = 32
 
     # Backtesting
     backtest_max_splits: int = 20
@@ -0,0 +1,35 @@
+"""Response classes for high-volume JSON endpoints.
+
+FastAPI's default JSONResponse first converts the returned model with
+jsonable_encoder and then serializes the result with the stdlib json module.
+For large payloads (feature rows, dimension pages) that double walk dominates
+the request time, so these endpoints render models directly with
+pydantic-core's serializer instead.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core.
+
+    Accepts Pydantic models (and plain JSON-compatible values) as content and
+    serializes them in a single pass without intermediate dict conversion.
+
+    Example:
+        >>> return PydanticJSONResponse(content=ComputeFeaturesResponse(...))
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Serialize content to JSON bytes.
+
+        Args:
+            content: Pydantic model or JSON-compatible value.
+
+        Returns:
+            UTF-8 encoded JSON document.
+        """
+        return to_json(content)
@@ -0,0 +1,34 @@
+"""Tests for pydantic-core backed JSON responses."""
+
+import json
+from datetime import date
+
+from pydantic import BaseModel
+
+from app.core.responses import PydanticJSONResponse
+
+
+class _Row(BaseModel):
+    day: date
+    values: dict[str, float | int | None]
+
+
+def test_renders_pydantic_model():
+    """Models should be serialized with their field types preserved."""
+    response = PydanticJSONResponse(
+        content=_Row(day=date(2024, 1, 31), values={"lag_1": 1.5, "lag_7": None, "q": 3})
+    )
+
+    assert response.media_type == "application/json"
+    assert json.loads(bytes(response.body)) == {
+        "day": "2024-01-31",
+        "values": {"lag_1": 1.5, "lag_7": None, "q": 3},
+    }
+
+
+def test_renders_plain_values():
+    """Plain JSON-compatible values should still be supported."""
+    response = PydanticJSONResponse(content={"total": 2, "items": [1, 2]}, status_code=201)
+
+    assert response.status_code == 201
+    assert json.loads(bytes(response.body)) == {"total": 2, "items": [1, 2]}
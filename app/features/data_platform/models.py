@@ -60,6 +60,22 @@ class Store(TimestampMixin, Base):
     promotions: Mapped[list[Promotion]] = relationship(back_populates="store")
     inventory_snapshots: Mapped[list[InventorySnapshotDaily]] = relationship(back_populates="store")
 
+    __table_args__ = (
+        # Trigram GIN indexes accelerate ILIKE '%search%' (requires pg_trgm)
+        Index(
+            "ix_store_code_trgm",
+            "code",
+            postgresql_using="gin",
+            postgresql_ops={"code": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_store_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
 
 class Product(TimestampMixin, Base):
     """Product dimension table.
@@ -92,6 +108,22 @@ class Product(TimestampMixin, Base):
         back_populates="product"
     )
 
+    __table_args__ = (
+        # Trigram GIN indexes accelerate ILIKE '%search%' (requires pg_trgm)
+        Index(
+            "ix_product_sku_trgm",
+            "sku",
+            postgresql_using="gin",
+            postgresql_ops={"sku": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_product_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
 
 class Calendar(TimestampMixin, Base):
     """Calendar dimension table for time-based analysis.
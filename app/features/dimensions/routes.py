@@ -4,11 +4,15 @@ These endpoints enable LLM agents and users to discover available stores
 and products before calling ingest, training, or forecasting endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.logging import get_logger
+from app.core.responses import PydanticJSONResponse
 from app.features.dimensions.schemas import (
     ProductListResponse,
     ProductResponse,
@@ -22,6 +26,48 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/dimensions", tags=["dimensions"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against the current ETag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value (may list several tags).
+        etag: Current quoted ETag.
+
+    Returns:
+        True if the client's cached representation is still current.
+    """
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _conditional_list_response(request: Request, content: BaseModel) -> Response:
+    """Render a list page with an ETag derived from its JSON body.
+
+    Hashing the rendered page costs no extra query; the tag changes whenever
+    the page rows, their timestamps or the total change. The page (and COUNT,
+    when needed) still runs and is rendered before the comparison, so a 304
+    only saves transferring the body, not the database or serialization work.
+    A cheaper pre-query validator would need a table-wide max(updated_at)
+    probe, which has no supporting index.
+
+    Args:
+        request: Incoming request (for If-None-Match).
+        content: List response model to render.
+
+    Returns:
+        The rendered page with an ETag header, or 304 Not Modified if the
+        client's cached representation is still current.
+    """
+    response = PydanticJSONResponse(content=content)
+    etag = f'"{hashlib.sha256(response.body).hexdigest()[:32]}"'
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
 # =============================================================================
 # Store Endpoints
 # =============================================================================
@@ -30,6 +76,7 @@ router = APIRouter(prefix="/dimensions", tags=["dimensions"])
 @router.get(
     "/stores",
     response_model=StoreListResponse,
+    response_class=PydanticJSONResponse,
     summary="List all stores",
     description="""
 Discover available stores for use in other API endpoints.
@@ -47,6 +94,10 @@ required by ingest, training, and forecasting endpoints.
 - Default: 20 items per page, maximum: 100
 - Use `total` in response to calculate total pages
 
+**Caching**:
+- Responses carry an `ETag`; send it back in `If-None-Match` to get 304 Not Modified
+  while the page is unchanged (saves the response body; the page is still queried)
+
 **Example Use Cases**:
 1. Get all stores: `GET /dimensions/stores`
 2. Find stores by region: `GET /dimensions/stores?region=North`
@@ -54,6 +105,7 @@ required by ingest, training, and forecasting endpoints.
 """,
 )
 async def list_stores(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Stores per page (max 100)"),
@@ -64,10 +116,11 @@ async def list_stores(
         min_length=2,
         description="Search in code and name (case-insensitive)",
     ),
-) -> StoreListResponse:
+) -> Response:
     """List stores with pagination and filtering.
 
     Args:
+        request: Incoming request (for If-None-Match).
         db: Database session.
         page: Page number (1-indexed).
         page_size: Number of stores per page.
@@ -76,10 +129,10 @@ async def list_stores(
         search: Search in code and name.
 
     Returns:
-        Paginated list of stores.
+        Paginated list of stores, or 304 Not Modified if the client's ETag matches.
     """
     service = DimensionService()
-    return await service.list_stores(
+    result = await service.list_stores(
         db=db,
         page=page,
         page_size=page_size,
@@ -87,6 +140,7 @@ async def list_stores(
         store_type=store_type,
         search=search,
     )
+    return _conditional_list_response(request, result)
 
 
 @router.get(
@@ -141,6 +195,7 @@ async def get_store(
 @router.get(
     "/products",
     response_model=ProductListResponse,
+    response_class=PydanticJSONResponse,
     summary="List all products",
     description="""
 Discover available products for use in other API endpoints.
@@ -158,6 +213,10 @@ required by ingest, training, and forecasting endpoints.
 - Default: 20 items per page, maximum: 100
 - Use `total` in response to calculate total pages
 
+**Caching**:
+- Responses carry an `ETag`; send it back in `If-None-Match` to get 304 Not Modified
+  while the page is unchanged (saves the response body; the page is still queried)
+
 **Example Use Cases**:
 1. Get all products: `GET /dimensions/products`
 2. Find products by category: `GET /dimensions/products?category=Beverage`
@@ -165,6 +224,7 @@ required by ingest, training, and forecasting endpoints.
 """,
 )
 async def list_products(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Products per page (max 100)"),
@@ -175,10 +235,11 @@ async def list_products(
         min_length=2,
         description="Search in SKU and name (case-insensitive)",
     ),
-) -> ProductListResponse:
+) -> Response:
     """List products with pagination and filtering.
 
     Args:
+        request: Incoming request (for If-None-Match).
         db: Database session.
         page: Page number (1-indexed).
         page_size: Number of products per page.
@@ -187,10 +248,10 @@ async def list_products(
         search: Search in SKU and name.
 
     Returns:
-        Paginated list of products.
+        Paginated list of products, or 304 Not Modified if the client's ETag matches.
     """
     service = DimensionService()
-    return await service.list_products(
+    result = await service.list_products(
         db=db,
         page=page,
         page_size=page_size,
@@ -198,6 +259,7 @@ async def list_products(
         brand=brand,
         search=search,
     )
+    return _conditional_list_response(request, result)
 
 
 @router.get(
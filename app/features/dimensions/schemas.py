@@ -23,7 +23,7 @@ class StoreResponse(BaseModel):
     The 'id' field should be used as the store_id parameter in other API calls.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int = Field(
         ...,
@@ -107,7 +107,7 @@ class ProductResponse(BaseModel):
     The 'id' field should be used as the product_id parameter in other API calls.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int = Field(
         ...,
@@ -4,7 +4,10 @@ Provides paginated access to Store and Product dimension tables
 with filtering and search capabilities.
 """
 
-from sqlalchemy import func, or_, select
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Select, bindparam, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
@@ -18,6 +21,116 @@ from app.features.dimensions.schemas import (
 
 logger = get_logger(__name__)
 
+# Single-row lookups are prebuilt once with bind parameters so each call only
+# supplies values instead of constructing a new Select object. LIMIT 1 lets the
+# database stop at the first match. Primary-key lookups use AsyncSession.get(),
+# which checks the identity map before emitting SQL.
+_GET_STORE_BY_CODE = select(Store).where(Store.code == bindparam("code")).limit(1)
+_GET_PRODUCT_BY_SKU = select(Product).where(Product.sku == bindparam("sku")).limit(1)
+
+
+@lru_cache(maxsize=8)
+def _store_list_statements(
+    has_region: bool,
+    has_store_type: bool,
+    has_search: bool,
+) -> tuple[Select[tuple[int]], Select[tuple[Store]]]:
+    """Build (and memoize) the count and page statements for a filter shape.
+
+    There are only 2^3 filter shapes, so each Select is constructed once and
+    reused with bind parameters for the filter values and pagination.
+
+    Args:
+        has_region: Whether the region filter is active.
+        has_store_type: Whether the store_type filter is active.
+        has_search: Whether the code/name search is active.
+
+    Returns:
+        Tuple of (count statement, paginated page statement).
+    """
+    stmt = select(Store)
+    if has_region:
+        stmt = stmt.where(Store.region == bindparam("region"))
+    if has_store_type:
+        stmt = stmt.where(Store.store_type == bindparam("store_type"))
+    if has_search:
+        stmt = stmt.where(
+            or_(
+                Store.code.ilike(bindparam("search_pattern")),
+                Store.name.ilike(bindparam("search_pattern")),
+            )
+        )
+
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    page_stmt = stmt.order_by(Store.code).offset(bindparam("offset")).limit(bindparam("limit"))
+    return count_stmt, page_stmt
+
+
+@lru_cache(maxsize=8)
+def _product_list_statements(
+    has_category: bool,
+    has_brand: bool,
+    has_search: bool,
+) -> tuple[Select[tuple[int]], Select[tuple[Product]]]:
+    """Build (and memoize) the count and page statements for a filter shape.
+
+    Args:
+        has_category: Whether the category filter is active.
+        has_brand: Whether the brand filter is active.
+        has_search: Whether the SKU/name search is active.
+
+    Returns:
+        Tuple of (count statement, paginated page statement).
+    """
+    stmt = select(Product)
+    if has_category:
+        stmt = stmt.where(Product.category == bindparam("category"))
+    if has_brand:
+        stmt = stmt.where(Product.brand == bindparam("brand"))
+    if has_search:
+        stmt = stmt.where(
+            or_(
+                Product.sku.ilike(bindparam("search_pattern")),
+                Product.name.ilike(bindparam("search_pattern")),
+            )
+        )
+
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    page_stmt = stmt.order_by(Product.sku).offset(bindparam("offset")).limit(bindparam("limit"))
+    return count_stmt, page_stmt
+
+
+async def _resolve_total(
+    db: AsyncSession,
+    count_stmt: Select[tuple[int]],
+    params: dict[str, Any],
+    offset: int,
+    page_size: int,
+    fetched: int,
+) -> int:
+    """Return the total row count for a paginated query.
+
+    A partial page already determines the total (offset + rows fetched), which
+    covers selective filters such as an exact code/SKU search. The separate
+    COUNT(*) round-trip only runs when the page is full or lies past the end.
+
+    Args:
+        db: Database session.
+        count_stmt: COUNT(*) statement over the filtered query.
+        params: Bind parameter values for the filters.
+        offset: Number of rows skipped before the current page.
+        page_size: Maximum rows per page.
+        fetched: Number of rows returned for the current page.
+
+    Returns:
+        Total number of rows matching the filters.
+    """
+    if 0 < fetched < page_size or (fetched == 0 and offset == 0):
+        return offset + fetched
+
+    total_result = await db.execute(count_stmt, params)
+    return int(total_result.scalar_one())
+
 
 class DimensionService:
     """Service for discovering stores and products.
@@ -48,35 +161,28 @@ class DimensionService:
         Returns:
             Paginated list of stores.
         """
-        # Build base query
-        stmt = select(Store)
+        # Reuse the prebuilt statements for this filter shape
+        has_search = search is not None and len(search) >= 2
+        count_stmt, page_stmt = _store_list_statements(
+            region is not None, store_type is not None, has_search
+        )
 
-        # Apply filters
+        offset = (page - 1) * page_size
+        params: dict[str, Any] = {"offset": offset, "limit": page_size}
         if region is not None:
-            stmt = stmt.where(Store.region == region)
+            params["region"] = region
         if store_type is not None:
-            stmt = stmt.where(Store.store_type == store_type)
-        if search is not None and len(search) >= 2:
-            search_pattern = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    Store.code.ilike(search_pattern),
-                    Store.name.ilike(search_pattern),
-                )
-            )
+            params["store_type"] = store_type
+        if has_search:
+            params["search_pattern"] = f"%{search}%"
 
-        # Count total before pagination
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await db.execute(count_stmt)
-        total = total_result.scalar_one()
+        # Pages are capped at 100 rows, so a buffered fetch beats a server-side cursor
+        stores = [
+            StoreResponse.model_validate(store) for store in await db.scalars(page_stmt, params)
+        ]
 
-        # Apply pagination and ordering
-        offset = (page - 1) * page_size
-        stmt = stmt.order_by(Store.code).offset(offset).limit(page_size)
-
-        # Execute query
-        result = await db.execute(stmt)
-        stores = result.scalars().all()
+        # Count total (skipped when the page itself determines it)
+        total = await _resolve_total(db, count_stmt, params, offset, page_size, len(stores))
 
         logger.info(
             "dimensions.stores_listed",
@@ -87,7 +193,7 @@ class DimensionService:
         )
 
         return StoreListResponse(
-            stores=[StoreResponse.model_validate(store) for store in stores],
+            stores=stores,
             total=total,
             page=page,
             page_size=page_size,
@@ -107,9 +213,7 @@ class DimensionService:
         Returns:
             Store details or None if not found.
         """
-        stmt = select(Store).where(Store.id == store_id)
-        result = await db.execute(stmt)
-        store = result.scalar_one_or_none()
+        store = await db.get(Store, store_id)
 
         if store is None:
             return None
@@ -130,9 +234,8 @@ class DimensionService:
         Returns:
             Store details or None if not found.
         """
-        stmt = select(Store).where(Store.code == code)
-        result = await db.execute(stmt)
-        store = result.scalar_one_or_none()
+        result = await db.execute(_GET_STORE_BY_CODE, {"code": code})
+        store = result.scalars().first()
 
         if store is None:
             return None
@@ -161,35 +264,29 @@ class DimensionService:
         Returns:
             Paginated list of products.
         """
-        # Build base query
-        stmt = select(Product)
+        # Reuse the prebuilt statements for this filter shape
+        has_search = search is not None and len(search) >= 2
+        count_stmt, page_stmt = _product_list_statements(
+            category is not None, brand is not None, has_search
+        )
 
-        # Apply filters
+        offset = (page - 1) * page_size
+        params: dict[str, Any] = {"offset": offset, "limit": page_size}
         if category is not None:
-            stmt = stmt.where(Product.category == category)
+            params["category"] = category
         if brand is not None:
-            stmt = stmt.where(Product.brand == brand)
-        if search is not None and len(search) >= 2:
-            search_pattern = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    Product.sku.ilike(search_pattern),
-                    Product.name.ilike(search_pattern),
-                )
-            )
-
-        # Count total before pagination
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await db.execute(count_stmt)
-        total = total_result.scalar_one()
+            params["brand"] = brand
+        if has_search:
+            params["search_pattern"] = f"%{search}%"
 
-        # Apply pagination and ordering
-        offset = (page - 1) * page_size
-        stmt = stmt.order_by(Product.sku).offset(offset).limit(page_size)
+        # Pages are capped at 100 rows, so a buffered fetch beats a server-side cursor
+        products = [
+            ProductResponse.model_validate(product)
+            for product in await db.scalars(page_stmt, params)
+        ]
 
-        # Execute query
-        result = await db.execute(stmt)
-        products = result.scalars().all()
+        # Count total (skipped when the page itself determines it)
+        total = await _resolve_total(db, count_stmt, params, offset, page_size, len(products))
 
         logger.info(
             "dimensions.products_listed",
@@ -200,7 +297,7 @@ class DimensionService:
         )
 
         return ProductListResponse(
-            products=[ProductResponse.model_validate(product) for product in products],
+            products=products,
             total=total,
             page=page,
             page_size=page_size,
@@ -220,9 +317,7 @@ class DimensionService:
         Returns:
             Product details or None if not found.
         """
-        stmt = select(Product).where(Product.id == product_id)
-        result = await db.execute(stmt)
-        product = result.scalar_one_or_none()
+        product = await db.get(Product, product_id)
 
         if product is None:
             return None
@@ -243,9 +338,8 @@ class DimensionService:
         Returns:
             Product details or None if not found.
         """
-        stmt = select(Product).where(Product.sku == sku)
-        result = await db.execute(stmt)
-        product = result.scalar_one_or_none()
+        result = await db.execute(_GET_PRODUCT_BY_SKU, {"sku": sku})
+        product = result.scalars().first()
 
         if product is None:
             return None
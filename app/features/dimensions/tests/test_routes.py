@@ -0,0 +1,54 @@
+"""Unit tests for dimension route helpers."""
+
+import pytest
+from starlette.requests import Request
+
+from app.features.dimensions.routes import _conditional_list_response, _etag_matches
+from app.features.dimensions.schemas import StoreListResponse
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"old", "abc"', True),
+        ("*", True),
+        ('"old"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    """If-None-Match should match exact, weak, listed and wildcard tags."""
+    assert _etag_matches(header, '"abc"') is expected
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+def test_conditional_list_response_tags_rendered_page():
+    """The ETag should be stable for the same page and change with its content."""
+    page = StoreListResponse(stores=[], total=0, page=1, page_size=20)
+    other_page = StoreListResponse(stores=[], total=0, page=2, page_size=20)
+
+    first = _conditional_list_response(_request(), page)
+    second = _conditional_list_response(_request(), page)
+    other = _conditional_list_response(_request(), other_page)
+
+    assert first.status_code == 200
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["etag"] != other.headers["etag"]
+
+
+def test_conditional_list_response_not_modified():
+    """A matching If-None-Match should yield 304 with the same ETag and no body."""
+    page = StoreListResponse(stores=[], total=0, page=1, page_size=20)
+    etag = _conditional_list_response(_request(), page).headers["etag"]
+
+    response = _conditional_list_response(_request(etag), page)
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.body == b""
@@ -0,0 +1,66 @@
+"""Unit tests for dimension service helpers."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.features.dimensions.service import (
+    _product_list_statements,
+    _resolve_total,
+    _store_list_statements,
+)
+
+
+class TestResolveTotal:
+    """Tests for the COUNT(*) short-circuit on paginated queries."""
+
+    @pytest.mark.parametrize(
+        ("offset", "page_size", "fetched", "expected"),
+        [
+            (0, 20, 1, 1),  # exact code search on first page
+            (0, 20, 0, 0),  # no matches at all
+            (40, 20, 5, 45),  # last partial page
+        ],
+    )
+    async def test_partial_page_skips_count(self, offset, page_size, fetched, expected):
+        """A partial page determines the total without querying."""
+        mock_db = AsyncMock()
+        count_stmt, _ = _store_list_statements(False, False, False)
+
+        total = await _resolve_total(mock_db, count_stmt, {}, offset, page_size, fetched)
+
+        assert total == expected
+        mock_db.execute.assert_not_awaited()
+
+    @pytest.mark.parametrize(("offset", "fetched"), [(0, 20), (100, 0)])
+    async def test_full_or_out_of_range_page_counts(self, offset, fetched):
+        """Full pages and pages past the end fall back to COUNT(*)."""
+        mock_db = AsyncMock()
+        mock_db.execute = AsyncMock(return_value=MagicMock(scalar_one=MagicMock(return_value=57)))
+        count_stmt, _ = _store_list_statements(False, False, False)
+
+        total = await _resolve_total(mock_db, count_stmt, {}, offset, 20, fetched)
+
+        assert total == 57
+        mock_db.execute.assert_awaited_once()
+
+
+class TestListStatements:
+    """Tests for filter-shape statement memoization."""
+
+    def test_same_shape_reuses_statements(self):
+        """Repeated calls with the same filter shape return the cached objects."""
+        assert _store_list_statements(True, False, True) is _store_list_statements(
+            True, False, True
+        )
+        assert _product_list_statements(False, True, False) is _product_list_statements(
+            False, True, False
+        )
+
+    def test_statements_bind_only_active_filters(self):
+        """Only the active filters (plus pagination) appear as bind parameters."""
+        _, page_stmt = _store_list_statements(True, False, True)
+
+        params = set(page_stmt.compile().params)
+
+        assert params == {"region", "search_pattern", "offset", "limit"}
@@ -2,6 +2,7 @@
 
 from app.features.featuresets.schemas import (
     CalendarConfig,
+    ComputeFeaturesColumnarResponse,
     ComputeFeaturesRequest,
     ComputeFeaturesResponse,
     ExogenousConfig,
@@ -19,6 +20,7 @@ from app.features.featuresets.service import (
 
 __all__ = [
     "CalendarConfig",
+    "ComputeFeaturesColumnarResponse",
     "ComputeFeaturesRequest",
     "ComputeFeaturesResponse",
     "ExogenousConfig",
@@ -2,32 +2,281 @@
 
 import math
 import time
+from collections.abc import Iterator
 from datetime import date as date_type
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pandas.api.types import is_datetime64_any_dtype
+from pydantic_core import to_json
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
 from app.core.database import get_db
 from app.core.exceptions import DatabaseError, NotFoundError
 from app.core.logging import get_logger
+from app.core.responses import PydanticJSONResponse
 from app.features.featuresets.schemas import (
+    ComputeFeaturesColumnarResponse,
     ComputeFeaturesRequest,
     ComputeFeaturesResponse,
     FeatureRow,
     PreviewFeaturesRequest,
 )
-from app.features.featuresets.service import compute_features_for_series
+from app.features.featuresets.service import (
+    FeatureComputationResult,
+    compute_features_for_series,
+)
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/featuresets", tags=["featuresets"])
 
+# Rows converted per chunk when streaming /compute/stream responses
+STREAM_CHUNK_ROWS = 2048
+
+
+def _extract_dates(df: pd.DataFrame, date_column: str) -> list[date_type]:
+    """Convert the date column to a list of ``date`` objects.
+
+    A pandas column has a single dtype, so the conversion path is chosen
+    once per call instead of once per row.
+
+    Args:
+        df: Dataframe with computed features.
+        date_column: Name of the date column.
+
+    Returns:
+        List of dates aligned with the dataframe rows.
+    """
+    dates = df[date_column]
+    if is_datetime64_any_dtype(dates.dtype):
+        return list(dates.dt.date)
+    # Loaded from the database as python date objects (object dtype)
+    return list(dates)
+
+
+def _feature_values(values: pd.Series) -> list[float | int | None]:
+    """Convert a single feature column to JSON-ready python values.
+
+    NaN becomes None, floats stay floats and integer/boolean columns become ints.
+    The dtype is inspected once per column; numeric columns have missing values
+    replaced in a single vectorized pass instead of per-cell isnan checks.
+
+    Args:
+        values: Feature column.
+
+    Returns:
+        List of python values aligned with the column rows.
+    """
+    kind = values.dtype.kind if isinstance(values.dtype, np.dtype) else "O"
+    if kind in "iub":
+        return values.to_numpy(dtype=np.int64).tolist()
+
+    if kind == "f":
+        converted = values.to_numpy(dtype=object)
+        converted[values.isna().to_numpy()] = None
+        result: list[float | int | None] = converted.tolist()
+        return result
+
+    # Object or extension dtype: fall back to per-value inspection
+    fallback: list[float | int | None] = []
+    for val in values.tolist():
+        if val is None or (isinstance(val, float) and math.isnan(val)):
+            fallback.append(None)
+        elif isinstance(val, (int, float)):
+            fallback.append(float(val) if isinstance(val, float) else int(val))
+        else:
+            fallback.append(None)
+    return fallback
+
+
+def _validate_entity_ids(df: pd.DataFrame) -> None:
+    """Ensure every row has a positive store_id and product_id.
+
+    Checked with one vectorized comparison per column instead of per-row branches.
+
+    Args:
+        df: Dataframe with computed features.
+
+    Raises:
+        HTTPException: If any store_id/product_id is missing or below 1.
+    """
+    for column in ("store_id", "product_id"):
+        ids = df[column]
+        if ids.isna().any() or (ids < 1).any():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Missing or invalid {column} in data record",
+            )
+
+
+def _build_feature_rows(
+    df: pd.DataFrame,
+    feature_columns: list[str],
+    date_column: str,
+) -> list[FeatureRow]:
+    """Convert a computed feature dataframe to response rows.
+
+    Works on column arrays directly instead of ``to_dict("records")`` so no
+    intermediate per-row dicts are allocated.
+
+    Args:
+        df: Dataframe with computed features.
+        feature_columns: Names of the feature columns to include.
+        date_column: Name of the date column.
+
+    Returns:
+        List of feature rows in dataframe order.
+
+    Raises:
+        HTTPException: If a row has a missing or invalid store_id/product_id.
+    """
+    _validate_entity_ids(df)
+
+    dates = _extract_dates(df, date_column)
+    store_ids = df["store_id"].to_numpy(dtype=np.int64).tolist()
+    product_ids = df["product_id"].to_numpy(dtype=np.int64).tolist()
+    columns = list(_build_feature_columns(df, feature_columns).items())
+
+    # Trust boundary: every value here is produced server-side from the
+    # computed dataframe (ids checked above, dates/features already converted
+    # to Python scalars), so rows are built with model_construct() and skip
+    # validation. External input is still validated via the request models.
+    return [
+        FeatureRow.model_construct(
+            date=row_date,
+            store_id=store_ids[i],
+            product_id=product_ids[i],
+            features={col: values[i] for col, values in columns},
+        )
+        for i, row_date in enumerate(dates)
+    ]
+
+
+def _build_feature_columns(
+    df: pd.DataFrame,
+    feature_columns: list[str],
+) -> dict[str, list[float | int | None]]:
+    """Convert computed feature columns to JSON-ready value lists.
+
+    Args:
+        df: Dataframe with computed features.
+        feature_columns: Names of the feature columns to include.
+
+    Returns:
+        Mapping of feature name to values in dataframe order.
+    """
+    return {col: _feature_values(df[col]) for col in feature_columns}
+
+
+def _iter_feature_rows_ndjson(
+    df: pd.DataFrame,
+    feature_columns: list[str],
+    date_column: str,
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+) -> Iterator[bytes]:
+    """Yield feature rows as NDJSON lines, converting one chunk at a time.
+
+    Peak memory stays at one chunk of FeatureRow objects instead of the
+    full row list plus its serialized JSON document.
+
+    Args:
+        df: Dataframe with computed features.
+        feature_columns: Names of the feature columns to include.
+        date_column: Name of the date column.
+        chunk_rows: Number of dataframe rows converted per chunk.
+
+    Yields:
+        One JSON-encoded FeatureRow per line.
+    """
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start : start + chunk_rows]
+        for row in _build_feature_rows(chunk, feature_columns, date_column):
+            yield to_json(row) + b"\n"
+
+
+async def _load_features(
+    request: ComputeFeaturesRequest | PreviewFeaturesRequest,
+    db: AsyncSession,
+    event_prefix: str,
+    lookback_days: int,
+    failure_message: str = "Failed to compute features",
+) -> FeatureComputationResult:
+    """Compute features for the requested series, shared by the feature routes.
+
+    Logs the received request, translates database failures into
+    DatabaseError and rejects series with no data in the window.
+
+    Args:
+        request: Compute or preview request naming the series and config.
+        db: Async database session.
+        event_prefix: Log event prefix, e.g. ``featureops.compute``.
+        lookback_days: Days of history to load before the cutoff.
+        failure_message: Message of the DatabaseError raised on SQL failures.
+
+    Returns:
+        Non-empty feature computation result.
+
+    Raises:
+        NotFoundError: If no data found for the series.
+        DatabaseError: If database operation fails.
+    """
+    logger.info(
+        f"{event_prefix}_request_received",
+        store_id=request.store_id,
+        product_id=request.product_id,
+        cutoff_date=str(request.cutoff_date),
+        lookback_days=lookback_days,
+        config_hash=request.config.config_hash(),
+    )
+
+    try:
+        result = await compute_features_for_series(
+            db=db,
+            store_id=request.store_id,
+            product_id=request.product_id,
+            cutoff_date=request.cutoff_date,
+            lookback_days=lookback_days,
+            config=request.config,
+        )
+    except SQLAlchemyError as e:
+        logger.error(
+            f"{event_prefix}_request_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise DatabaseError(
+            message=failure_message,
+            details={"error": str(e)},
+        ) from e
+
+    if result.df.empty:
+        logger.warning(
+            f"{event_prefix}_no_data",
+            store_id=request.store_id,
+            product_id=request.product_id,
+        )
+        raise NotFoundError(
+            message=f"No data found for store_id={request.store_id}, product_id={request.product_id}",
+            details={
+                "store_id": request.store_id,
+                "product_id": request.product_id,
+                "cutoff_date": str(request.cutoff_date),
+            },
+        )
+
+    return result
+
 
 @router.post(
     "/compute",
     response_model=ComputeFeaturesResponse,
+    response_class=PydanticJSONResponse,
     status_code=status.HTTP_200_OK,
     summary="Compute features for a series",
     description="""
@@ -49,7 +298,7 @@ Each sub-config (lag_config, rolling_config, etc.) can be null to disable.
 async def compute_features(
     request: ComputeFeaturesRequest,
     db: AsyncSession = Depends(get_db),
-) -> ComputeFeaturesResponse:
+) -> PydanticJSONResponse:
     """Compute features for a single series.
 
     Args:
@@ -64,137 +313,172 @@ async def compute_features(
         DatabaseError: If database operation fails.
     """
     start_time = time.perf_counter()
+    result = await _load_features(request, db, "featureops.compute", request.lookback_days)
+    duration_ms = (time.perf_counter() - start_time) * 1000
+
+    rows = _build_feature_rows(result.df, result.feature_columns, request.config.date_column)
+
+    # Convert null_counts values to int
+    null_counts = {k: int(v) for k, v in result.stats.get("null_counts", {}).items()}
+
+    # Render straight through pydantic-core; skips jsonable_encoder + json.dumps.
+    # The completion log runs as a background task after the body is sent.
+    return PydanticJSONResponse(
+        content=ComputeFeaturesResponse(
+            rows=rows,
+            feature_columns=result.feature_columns,
+            config_hash=result.config_hash,
+            cutoff_date=request.cutoff_date,
+            row_count=len(rows),
+            null_counts=null_counts,
+            duration_ms=round(duration_ms, 2),
+        ),
+        background=BackgroundTask(
+            logger.info,
+            "featureops.compute_request_completed",
+            store_id=request.store_id,
+            product_id=request.product_id,
+            row_count=len(rows),
+            feature_count=len(result.feature_columns),
+            duration_ms=round(duration_ms, 2),
+        ),
+    )
+
+
+@router.post(
+    "/compute/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Compute features for a series as NDJSON",
+    description="""
+Compute time-safe features for a single store/product series and stream the rows.
+
+Uses the same computation logic as /compute but emits one FeatureRow JSON object
+per line (`application/x-ndjson`) so memory stays flat for long lookback windows.
+
+**Response Headers:**
+- `X-Config-Hash`: Hash of the configuration used
+- `X-Row-Count`: Number of rows in the stream
+- `X-Feature-Columns`: Comma-separated feature column names
+""",
+    response_class=StreamingResponse,
+)
+async def compute_features_stream(
+    request: ComputeFeaturesRequest,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Compute features for a single series and stream them as NDJSON.
+
+    Args:
+        request: Feature computation request with config.
+        db: Async database session from dependency.
+
+    Returns:
+        Streaming NDJSON response with one feature row per line.
+
+    Raises:
+        NotFoundError: If no data found for the series.
+        DatabaseError: If database operation fails.
+    """
+    start_time = time.perf_counter()
+    result = await _load_features(request, db, "featureops.compute_stream", request.lookback_days)
+
+    # Validate the whole frame up front; errors can't change the status mid-stream
+    _validate_entity_ids(result.df)
+
+    duration_ms = (time.perf_counter() - start_time) * 1000
 
     logger.info(
-        "featureops.compute_request_received",
+        "featureops.compute_stream_request_started",
         store_id=request.store_id,
         product_id=request.product_id,
-        cutoff_date=str(request.cutoff_date),
-        lookback_days=request.lookback_days,
-        config_hash=request.config.config_hash(),
+        row_count=len(result.df),
+        feature_count=len(result.feature_columns),
+        duration_ms=round(duration_ms, 2),
     )
 
-    try:
-        result = await compute_features_for_series(
-            db=db,
-            store_id=request.store_id,
-            product_id=request.product_id,
-            cutoff_date=request.cutoff_date,
-            lookback_days=request.lookback_days,
-            config=request.config,
-        )
+    return StreamingResponse(
+        _iter_feature_rows_ndjson(result.df, result.feature_columns, request.config.date_column),
+        media_type="application/x-ndjson",
+        headers={
+            "X-Config-Hash": result.config_hash,
+            "X-Row-Count": str(len(result.df)),
+            "X-Feature-Columns": ",".join(result.feature_columns),
+        },
+    )
 
-        duration_ms = (time.perf_counter() - start_time) * 1000
 
-        # Check if any data was found
-        if result.df.empty:
-            logger.warning(
-                "featureops.compute_no_data",
-                store_id=request.store_id,
-                product_id=request.product_id,
-            )
-            raise NotFoundError(
-                message=f"No data found for store_id={request.store_id}, product_id={request.product_id}",
-                details={
-                    "store_id": request.store_id,
-                    "product_id": request.product_id,
-                    "cutoff_date": str(request.cutoff_date),
-                },
-            )
+@router.post(
+    "/compute/columnar",
+    response_model=ComputeFeaturesColumnarResponse,
+    response_class=PydanticJSONResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Compute features for a series in columnar layout",
+    description="""
+Compute time-safe features for a single store/product series, returned column-wise.
 
-        # Convert dataframe to response rows using records for type safety
-        rows: list[FeatureRow] = []
-        records = result.df.to_dict("records")
-        for record in records:
-            # Extract features, handling NaN/None
-            features: dict[str, float | int | None] = {}
-            for col in result.feature_columns:
-                val = record.get(col)
-                if val is None or (isinstance(val, float) and math.isnan(val)):
-                    features[col] = None
-                elif isinstance(val, (int, float)):
-                    features[col] = float(val) if isinstance(val, float) else int(val)
-                else:
-                    features[col] = None
-
-            # Extract date, handling Timestamp
-            date_val = record.get(request.config.date_column)
-            row_date: date_type
-            if isinstance(date_val, pd.Timestamp):
-                row_date = date_val.date()
-            elif isinstance(date_val, date_type):
-                row_date = date_val
-            elif date_val is not None and hasattr(date_val, "date"):
-                row_date = date_val.date()
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Cannot extract date from unsupported type: {type(date_val).__name__}",
-                )
-
-            # Validate store_id/product_id presence
-            store_id_val = record.get("store_id")
-            product_id_val = record.get("product_id")
-            if store_id_val is None or int(store_id_val) < 1:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Missing or invalid store_id in data record",
-                )
-            if product_id_val is None or int(product_id_val) < 1:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Missing or invalid product_id in data record",
-                )
-
-            rows.append(
-                FeatureRow(
-                    date=row_date,
-                    store_id=int(store_id_val),
-                    product_id=int(product_id_val),
-                    features=features,
-                )
-            )
+Uses the same computation logic as /compute, but instead of one object per row the
+response carries `dates`, `store_ids`, `product_ids` and one value list per feature
+(all aligned by index). This avoids per-row objects for long lookback windows and
+maps directly onto dataframes on the client side.
+""",
+)
+async def compute_features_columnar(
+    request: ComputeFeaturesRequest,
+    db: AsyncSession = Depends(get_db),
+) -> PydanticJSONResponse:
+    """Compute features for a single series in columnar layout.
 
-        # Convert null_counts values to int
-        null_counts = {k: int(v) for k, v in result.stats.get("null_counts", {}).items()}
+    Args:
+        request: Feature computation request with config.
+        db: Async database session from dependency.
 
-        logger.info(
-            "featureops.compute_request_completed",
-            store_id=request.store_id,
-            product_id=request.product_id,
-            row_count=len(rows),
-            feature_count=len(result.feature_columns),
-            duration_ms=round(duration_ms, 2),
-        )
+    Returns:
+        Response with one value list per column and metadata.
 
-        return ComputeFeaturesResponse(
-            rows=rows,
+    Raises:
+        NotFoundError: If no data found for the series.
+        DatabaseError: If database operation fails.
+    """
+    start_time = time.perf_counter()
+    result = await _load_features(request, db, "featureops.compute_columnar", request.lookback_days)
+
+    _validate_entity_ids(result.df)
+
+    null_counts = {k: int(v) for k, v in result.stats.get("null_counts", {}).items()}
+    row_count = len(result.df)
+    duration_ms = (time.perf_counter() - start_time) * 1000
+
+    # All values are produced server-side from the computed dataframe, so the
+    # response is assembled with model_construct() (same trust boundary as rows).
+    return PydanticJSONResponse(
+        content=ComputeFeaturesColumnarResponse.model_construct(
+            dates=_extract_dates(result.df, request.config.date_column),
+            store_ids=result.df["store_id"].to_numpy(dtype=np.int64).tolist(),
+            product_ids=result.df["product_id"].to_numpy(dtype=np.int64).tolist(),
+            features=_build_feature_columns(result.df, result.feature_columns),
             feature_columns=result.feature_columns,
             config_hash=result.config_hash,
             cutoff_date=request.cutoff_date,
-            row_count=len(rows),
+            row_count=row_count,
             null_counts=null_counts,
             duration_ms=round(duration_ms, 2),
-        )
-
-    except NotFoundError:
-        raise
-    except SQLAlchemyError as e:
-        logger.error(
-            "featureops.compute_request_failed",
-            error=str(e),
-            error_type=type(e).__name__,
-            exc_info=True,
-        )
-        raise DatabaseError(
-            message="Failed to compute features",
-            details={"error": str(e)},
-        ) from e
+        ),
+        background=BackgroundTask(
+            logger.info,
+            "featureops.compute_columnar_request_completed",
+            store_id=request.store_id,
+            product_id=request.product_id,
+            row_count=row_count,
+            feature_count=len(result.feature_columns),
+            duration_ms=round(duration_ms, 2),
+        ),
+    )
 
 
 @router.post(
     "/preview",
     response_model=ComputeFeaturesResponse,
+    response_class=PydanticJSONResponse,
     status_code=status.HTTP_200_OK,
     summary="Preview features for a series",
     description="""
@@ -207,7 +491,7 @@ Uses the same computation logic as /compute but limits output rows.
 async def preview_features(
     request: PreviewFeaturesRequest,
     db: AsyncSession = Depends(get_db),
-) -> ComputeFeaturesResponse:
+) -> PydanticJSONResponse:
     """Preview features for a single series.
 
     Args:
@@ -222,102 +506,27 @@ async def preview_features(
         DatabaseError: If database operation fails.
     """
     start_time = time.perf_counter()
-
-    logger.info(
-        "featureops.preview_request_received",
-        store_id=request.store_id,
-        product_id=request.product_id,
-        cutoff_date=str(request.cutoff_date),
-        sample_rows=request.sample_rows,
+    # Use default lookback for preview
+    result = await _load_features(
+        request,
+        db,
+        "featureops.preview",
+        lookback_days=365,
+        failure_message="Failed to preview features",
     )
+    duration_ms = (time.perf_counter() - start_time) * 1000
 
-    try:
-        # Use default lookback for preview
-        result = await compute_features_for_series(
-            db=db,
-            store_id=request.store_id,
-            product_id=request.product_id,
-            cutoff_date=request.cutoff_date,
-            lookback_days=365,
-            config=request.config,
-        )
-
-        duration_ms = (time.perf_counter() - start_time) * 1000
-
-        if result.df.empty:
-            raise NotFoundError(
-                message=f"No data found for store_id={request.store_id}, product_id={request.product_id}",
-                details={
-                    "store_id": request.store_id,
-                    "product_id": request.product_id,
-                },
-            )
+    # Limit to sample_rows (take last N rows)
+    sample_df = result.df.tail(request.sample_rows)
 
-        # Limit to sample_rows (take last N rows)
-        sample_df = result.df.tail(request.sample_rows)
-
-        # Convert to response rows using records for type safety
-        rows: list[FeatureRow] = []
-        records = sample_df.to_dict("records")
-        for record in records:
-            # Extract features, handling NaN/None
-            features: dict[str, float | int | None] = {}
-            for col in result.feature_columns:
-                val = record.get(col)
-                if val is None or (isinstance(val, float) and math.isnan(val)):
-                    features[col] = None
-                elif isinstance(val, (int, float)):
-                    features[col] = float(val) if isinstance(val, float) else int(val)
-                else:
-                    features[col] = None
-
-            # Extract date, handling Timestamp
-            date_val = record.get(request.config.date_column)
-            row_date: date_type
-            if isinstance(date_val, pd.Timestamp):
-                row_date = date_val.date()
-            elif isinstance(date_val, date_type):
-                row_date = date_val
-            elif date_val is not None and hasattr(date_val, "date"):
-                row_date = date_val.date()
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Cannot extract date from unsupported type: {type(date_val).__name__}",
-                )
-
-            # Validate store_id/product_id presence
-            store_id_val = record.get("store_id")
-            product_id_val = record.get("product_id")
-            if store_id_val is None or int(store_id_val) < 1:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Missing or invalid store_id in data record",
-                )
-            if product_id_val is None or int(product_id_val) < 1:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Missing or invalid product_id in data record",
-                )
-
-            rows.append(
-                FeatureRow(
-                    date=row_date,
-                    store_id=int(store_id_val),
-                    product_id=int(product_id_val),
-                    features=features,
-                )
-            )
+    rows = _build_feature_rows(sample_df, result.feature_columns, request.config.date_column)
 
-        null_counts = {k: int(v) for k, v in result.stats.get("null_counts", {}).items()}
+    null_counts = {k: int(v) for k, v in result.stats.get("null_counts", {}).items()}
 
-        logger.info(
-            "featureops.preview_request_completed",
-            row_count=len(rows),
-            duration_ms=round(duration_ms, 2),
-        )
-
-        return ComputeFeaturesResponse(
+    # Render straight through pydantic-core; skips jsonable_encoder + json.dumps.
+    # The completion log runs as a background task after the body is sent.
+    return PydanticJSONResponse(
+        content=ComputeFeaturesResponse(
             rows=rows,
             feature_columns=result.feature_columns,
             config_hash=result.config_hash,
@@ -325,18 +534,12 @@ async def preview_features(
             row_count=len(rows),
             null_counts=null_counts,
             duration_ms=round(duration_ms, 2),
-        )
-
-    except NotFoundError:
-        raise
-    except SQLAlchemyError as e:
-        logger.error(
-            "featureops.preview_request_failed",
-            error=str(e),
-            error_type=type(e).__name__,
-            exc_info=True,
-        )
-        raise DatabaseError(
-            message="Failed to preview features",
-            details={"error": str(e)},
-        ) from e
+        ),
+        background=BackgroundTask(
+            logger.info,
+            "featureops.preview_request_completed",
+            sample_rows=request.sample_rows,
+            row_count=len(rows),
+            duration_ms=round(duration_ms, 2),
+        ),
+    )
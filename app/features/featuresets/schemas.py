@@ -8,14 +8,18 @@ Feature configs are designed to be:
 
 from __future__ import annotations
 
-import hashlib
 from datetime import date as date_type
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
+from app.shared.schemas import ConfigHashMixin
 
-class FeatureConfigBase(BaseModel):
+# Positive day offset; enforced natively by pydantic-core (no Python validator)
+PositiveDays = Annotated[int, Field(gt=0)]
+
+
+class FeatureConfigBase(ConfigHashMixin):
     """Base configuration with versioning support.
 
     All feature configs inherit from this base to ensure:
@@ -35,15 +39,6 @@ class FeatureConfigBase(BaseModel):
         pattern=r"^\d+\.\d+(\.\d+)?$",
     )
 
-    def config_hash(self) -> str:
-        """Generate deterministic hash of configuration.
-
-        Returns:
-            16-character hex string hash of config JSON.
-        """
-        config_json = self.model_dump_json()
-        return hashlib.sha256(config_json.encode()).hexdigest()[:16]
-
 
 class LagConfig(FeatureConfigBase):
     """Configuration for lag-based features.
@@ -58,8 +53,9 @@ class LagConfig(FeatureConfigBase):
         fill_value: Value to fill NaN (None = keep NaN).
     """
 
-    lags: tuple[int, ...] = Field(
+    lags: tuple[PositiveDays, ...] = Field(
         default=(1, 7, 14, 28),
+        min_length=1,
         description="Lag periods in days (must be positive)",
     )
     target_column: str = Field(default="quantity")
@@ -68,16 +64,6 @@ class LagConfig(FeatureConfigBase):
         description="Value to fill NaN (None = keep NaN)",
     )
 
-    @field_validator("lags")
-    @classmethod
-    def validate_lags_positive(cls, v: tuple[int, ...]) -> tuple[int, ...]:
-        """Ensure all lags are positive (no future leakage)."""
-        if not v:
-            raise ValueError("At least one lag must be specified")
-        if any(lag <= 0 for lag in v):
-            raise ValueError("All lags must be positive integers (no future leakage)")
-        return v
-
 
 class RollingConfig(FeatureConfigBase):
     """Configuration for rolling window features.
@@ -92,8 +78,9 @@ class RollingConfig(FeatureConfigBase):
         min_periods: Minimum observations required (None = window size).
     """
 
-    windows: tuple[int, ...] = Field(
+    windows: tuple[PositiveDays, ...] = Field(
         default=(7, 14, 28),
+        min_length=1,
         description="Window sizes in days",
     )
     aggregations: tuple[Literal["mean", "std", "min", "max", "sum"], ...] = Field(
@@ -106,16 +93,6 @@ class RollingConfig(FeatureConfigBase):
         description="Minimum observations required (None = window size)",
     )
 
-    @field_validator("windows")
-    @classmethod
-    def validate_windows_positive(cls, v: tuple[int, ...]) -> tuple[int, ...]:
-        """Ensure all windows are positive."""
-        if not v:
-            raise ValueError("At least one window must be specified")
-        if any(w <= 0 for w in v):
-            raise ValueError("All windows must be positive integers")
-        return v
-
 
 class CalendarConfig(FeatureConfigBase):
     """Configuration for calendar features.
@@ -165,7 +142,7 @@ class ExogenousConfig(FeatureConfigBase):
     """
 
     include_price: bool = True
-    price_lags: tuple[int, ...] = Field(
+    price_lags: tuple[PositiveDays, ...] = Field(
         default=(7, 28),
         description="Lag periods for price features",
     )
@@ -174,14 +151,6 @@ class ExogenousConfig(FeatureConfigBase):
     include_inventory: bool = False
     include_stockout_flag: bool = True
 
-    @field_validator("price_lags")
-    @classmethod
-    def validate_price_lags_positive(cls, v: tuple[int, ...]) -> tuple[int, ...]:
-        """Ensure all price lags are positive."""
-        if any(lag <= 0 for lag in v):
-            raise ValueError("All price lags must be positive integers")
-        return v
-
 
 class ImputationConfig(FeatureConfigBase):
     """Configuration for missing value imputation.
@@ -335,6 +304,37 @@ class ComputeFeaturesResponse(BaseModel):
     duration_ms: float
 
 
+class ComputeFeaturesColumnarResponse(BaseModel):
+    """Response body for POST /featuresets/compute/columnar.
+
+    Same content as ComputeFeaturesResponse, laid out column-wise: one list per
+    field instead of one object per row, so large windows avoid per-row objects.
+
+    Attributes:
+        dates: Date of each row.
+        store_ids: Store ID of each row.
+        product_ids: Product ID of each row.
+        features: Feature name to values, aligned with dates.
+        feature_columns: List of computed feature column names.
+        config_hash: Hash of the configuration used.
+        cutoff_date: Cutoff date used.
+        row_count: Number of rows returned.
+        null_counts: Count of null values per feature.
+        duration_ms: Processing duration in milliseconds.
+    """
+
+    dates: list[date_type]
+    store_ids: list[int]
+    product_ids: list[int]
+    features: dict[str, list[float | int | None]]
+    feature_columns: list[str]
+    config_hash: str
+    cutoff_date: date_type
+    row_count: int
+    null_counts: dict[str, int]
+    duration_ms: float
+
+
 class PreviewFeaturesRequest(BaseModel):
     """Request for POST /featuresets/preview.
 
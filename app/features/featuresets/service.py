@@ -9,6 +9,7 @@ CRITICAL: All feature computation respects cutoff_date to prevent leakage.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import date as date_type
 from datetime import timedelta
@@ -16,7 +17,7 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import select
+from sqlalchemy import Select, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
@@ -28,6 +29,76 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# New feature columns produced by one computation step, keyed by column name
+FeatureColumns = dict[str, np.ndarray]
+
+# Cyclical encodings only take 7 (day of week) or 12 (month) distinct values,
+# so they are looked up from precomputed tables instead of evaluated per row
+_DOW_SIN = np.sin(2 * np.pi * np.arange(7) / 7)
+_DOW_COS = np.cos(2 * np.pi * np.arange(7) / 7)
+_MONTH_SIN = np.sin(2 * np.pi * np.arange(1, 13) / 12)
+_MONTH_COS = np.cos(2 * np.pi * np.arange(1, 13) / 12)
+
+
+def _group_ids(df: pd.DataFrame, entity_cols: list[str]) -> np.ndarray:
+    """Label contiguous entity runs of a frame sorted by entity + date.
+
+    A new group starts wherever any entity column changes from the previous
+    row, so the labels come from one vectorized comparison per column instead
+    of hashing the composite key.
+
+    Args:
+        df: Dataframe sorted by entity columns.
+        entity_cols: Columns defining the entity grain.
+
+    Returns:
+        int64 array with one group label per row, increasing from 0.
+    """
+    n_rows = len(df)
+    boundaries = np.zeros(n_rows, dtype=bool)
+    if n_rows:
+        boundaries[0] = True
+    for col in entity_cols:
+        values = df[col].to_numpy()
+        boundaries[1:] |= values[1:] != values[:-1]
+    return np.cumsum(boundaries) - 1
+
+
+def _nan_where_missing(missing: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Return values with NaN on rows whose date is missing (as .dt accessors do).
+
+    Args:
+        missing: Boolean mask of rows with a missing (NaT) date.
+        values: Calendar field values aligned with the mask.
+
+    Returns:
+        values unchanged if no date is missing, else a float copy with NaN.
+    """
+    if not missing.any():
+        return values
+    return np.where(missing, np.nan, values)
+
+
+def _shift_within_groups(values: np.ndarray, group_ids: np.ndarray, periods: int) -> np.ndarray:
+    """Shift values forward by ``periods`` rows without crossing group boundaries.
+
+    Equivalent to ``groupby(...).shift(periods)`` for contiguous groups: row i
+    takes row i - periods only if both rows belong to the same group.
+
+    Args:
+        values: float64 values in frame order.
+        group_ids: Contiguous group labels from ``_group_ids``.
+        periods: Positive number of rows to look back.
+
+    Returns:
+        float64 array with NaN where no same-group past value exists.
+    """
+    shifted = np.full(len(values), np.nan)
+    if periods < len(values):
+        same_group = group_ids[periods:] == group_ids[:-periods]
+        shifted[periods:] = np.where(same_group, values[:-periods], np.nan)
+    return shifted
+
 
 @dataclass
 class FeatureComputationResult:
@@ -89,49 +160,68 @@ class FeatureEngineeringService:
         Returns:
             FeatureComputationResult with computed features.
         """
+        config_hash = self.config.config_hash()
+
         logger.info(
             "featureops.compute_started",
-            config_hash=self.config.config_hash(),
+            config_hash=config_hash,
             row_count=len(df),
             cutoff_date=str(cutoff_date) if cutoff_date else None,
         )
 
         input_rows = len(df)
-        result = df.copy()
 
-        # CRITICAL: Sort by entity + date for correct lag/rolling computation
-        result = result.sort_values([*self.entity_cols, self.date_col])
+        # CRITICAL: Sort by entity + date for correct lag/rolling computation.
+        # sort_values returns a new frame, so the caller's df is never modified.
+        result = df.sort_values([*self.entity_cols, self.date_col])
+
+        # Dates are converted to day resolution once and shared by the cutoff
+        # filter and calendar step; the date column itself is left as given
+        days: np.ndarray | None = None
+        if cutoff_date or self.config.calendar_config:
+            days = pd.to_datetime(result[self.date_col]).to_numpy(dtype="datetime64[D]")
 
-        # CRITICAL: Filter to cutoff BEFORE any feature computation
-        if cutoff_date:
-            date_series = pd.to_datetime(result[self.date_col]).dt.date
-            result = result[date_series <= cutoff_date]
+        # CRITICAL: Filter to cutoff BEFORE any feature computation.
+        # Loaders already stop at the cutoff, so skip the copy when nothing is cut.
+        if cutoff_date and days is not None:
+            keep = days <= np.datetime64(cutoff_date, "D")
+            if not keep.all():
+                result = result[keep]
+                days = days[keep]
 
-        feature_columns: list[str] = []
+        # Entity labels computed once and shared by every group-aware step
+        group_ids = _group_ids(result, self.entity_cols)
 
         # 1. Apply imputation FIRST (fills gaps before lag/rolling)
         if self.config.imputation_config:
-            result = self._apply_imputation(result)
+            result, kept = self._apply_imputation(result, group_ids)
+            group_ids = group_ids[kept]
+            if days is not None:
+                days = days[kept]
+
+        # Each step only reads input columns and returns its new columns; they
+        # are appended in a single concat instead of copying the frame per step
+        new_columns: FeatureColumns = {}
 
         # 2. Lag features
         if self.config.lag_config:
-            result, cols = self._compute_lag_features(result)
-            feature_columns.extend(cols)
+            new_columns.update(self._compute_lag_features(result, group_ids))
 
         # 3. Rolling features (uses shifted data)
         if self.config.rolling_config:
-            result, cols = self._compute_rolling_features(result)
-            feature_columns.extend(cols)
+            new_columns.update(self._compute_rolling_features(result, group_ids))
 
         # 4. Calendar features (no leakage risk)
-        if self.config.calendar_config:
-            result, cols = self._compute_calendar_features(result)
-            feature_columns.extend(cols)
+        if self.config.calendar_config and days is not None:
+            new_columns.update(self._compute_calendar_features(days))
 
         # 5. Exogenous features
         if self.config.exogenous_config:
-            result, cols = self._compute_exogenous_features(result)
-            feature_columns.extend(cols)
+            new_columns.update(self._compute_exogenous_features(result, group_ids))
+
+        feature_columns = list(new_columns)
+        if new_columns:
+            result = pd.concat([result, pd.DataFrame(new_columns, index=result.index)], axis=1)
 
         # Compute stats
         null_counts: dict[str, int] = {}
@@ -149,7 +239,7 @@ class FeatureEngineeringService:
 
         logger.info(
             "featureops.compute_completed",
-            config_hash=self.config.config_hash(),
+            config_hash=config_hash,
             feature_count=len(feature_columns),
             output_rows=len(result),
         )
@@ -157,11 +247,11 @@ class FeatureEngineeringService:
         return FeatureComputationResult(
             df=result,
             feature_columns=feature_columns,
-            config_hash=self.config.config_hash(),
+            config_hash=config_hash,
             stats=stats,
         )
 
-    def _compute_lag_features(self, df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+    def _compute_lag_features(self, df: pd.DataFrame, group_ids: np.ndarray) -> FeatureColumns:
         """Compute lag features with proper grouping.
 
         CRITICAL: shift(lag) uses PAST data only (positive lag = look back).
@@ -169,30 +259,30 @@ class FeatureEngineeringService:
 
         Args:
             df: Input dataframe sorted by entity + date.
+            group_ids: Contiguous entity labels for df rows (see ``_group_ids``).
 
         Returns:
-            Tuple of (dataframe with lag features, list of new column names).
+            Mapping of new lag column name to values, aligned with df rows.
         """
         config = self.config.lag_config
         if config is None:
             raise RuntimeError("_compute_lag_features called without lag_config")
 
-        result = df.copy()
-        columns: list[str] = []
+        # Frame is sorted by entity + date, so each lag is one vectorized slice
+        # shift masked at group boundaries instead of a groupby.shift per lag
+        values = df[config.target_column].to_numpy(dtype=np.float64, na_value=np.nan)
 
+        lag_columns: FeatureColumns = {}
         for lag in config.lags:
-            col_name = f"lag_{lag}"
-            # CRITICAL: Group by entity to prevent cross-series leakage
-            result[col_name] = df.groupby(self.entity_cols, observed=True)[
-                config.target_column
-            ].shift(lag)  # Positive shift = look back in time
+            # CRITICAL: Positive shift = look back in time, never across entities
+            lagged = _shift_within_groups(values, group_ids, lag)
             if config.fill_value is not None:
-                result[col_name] = result[col_name].fillna(config.fill_value)
-            columns.append(col_name)
+                lagged[np.isnan(lagged)] = config.fill_value
+            lag_columns[f"lag_{lag}"] = lagged
 
-        return result, columns
+        return lag_columns
 
-    def _compute_rolling_features(self, df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+    def _compute_rolling_features(self, df: pd.DataFrame, group_ids: np.ndarray) -> FeatureColumns:
         """Compute rolling window features.
 
         CRITICAL: shift(1) BEFORE rolling to exclude current observation.
@@ -201,101 +291,100 @@ class FeatureEngineeringService:
 
         Args:
             df: Input dataframe sorted by entity + date.
+            group_ids: Contiguous entity labels for df rows (see ``_group_ids``).
 
         Returns:
-            Tuple of (dataframe with rolling features, list of new column names).
+            Mapping of new rolling column name to values, aligned with df rows.
         """
         config = self.config.rolling_config
         if config is None:
             raise RuntimeError("_compute_rolling_features called without rolling_config")
 
-        result = df.copy()
-        columns: list[str] = []
+        # CRITICAL: shift(1) within each entity, once for all windows/aggregations
+        values = df[config.target_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        shifted = pd.Series(_shift_within_groups(values, group_ids, 1))
+        grouped = shifted.groupby(group_ids, sort=False)
+        aggregations = list(config.aggregations)
 
+        rolling_columns: FeatureColumns = {}
         for window in config.windows:
             min_per = config.min_periods if config.min_periods is not None else window
+            # One grouped rolling pass per window computes every aggregation;
+            # contiguous ascending group ids keep the output in frame order
+            stats = grouped.rolling(window=window, min_periods=min_per).agg(aggregations)
+            for agg in aggregations:
+                rolling_columns[f"rolling_{agg}_{window}"] = stats[agg].to_numpy()
 
-            for agg in config.aggregations:
-                col_name = f"rolling_{agg}_{window}"
-
-                # CRITICAL: shift(1) prevents using current row in rolling calculation
-                def compute_rolling(
-                    x: pd.Series[float],
-                    w: int = window,
-                    m: int = min_per,
-                    a: str = agg,
-                ) -> pd.Series[float]:
-                    return x.shift(1).rolling(window=w, min_periods=m).agg(a)
-
-                result[col_name] = df.groupby(self.entity_cols, observed=True)[
-                    config.target_column
-                ].transform(compute_rolling)
-                columns.append(col_name)
+        return rolling_columns
 
-        return result, columns
-
-    def _compute_calendar_features(self, df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+    def _compute_calendar_features(self, days: np.ndarray) -> FeatureColumns:
         """Compute calendar-based features.
 
         Calendar features are derived from the date column itself,
         so there's no risk of future leakage.
 
         Args:
-            df: Input dataframe with date column.
+            days: Row dates as a ``datetime64[D]`` array.
 
         Returns:
-            Tuple of (dataframe with calendar features, list of new column names).
+            Mapping of new calendar column name to values, aligned with days.
         """
         config = self.config.calendar_config
         if config is None:
             raise RuntimeError("_compute_calendar_features called without calendar_config")
 
-        result = df.copy()
-        columns: list[str] = []
-        dates = pd.to_datetime(result[self.date_col])
+        columns: FeatureColumns = {}
+
+        # Derive every field from integer day/month counts since the epoch
+        # instead of going through the pandas .dt accessors
+        months = days.astype("datetime64[M]")
+        day_index = days.view(np.int64)
+        month_index = months.view(np.int64)
+        missing = np.isnat(days)
+
+        # Small-range fields use the narrowest integer dtype that holds them
+        dow = ((day_index + 3) % 7).astype(np.int8)  # 1970-01-01 was a Thursday; 0=Monday
+        month_zero = (month_index % 12).astype(np.int8)  # 0=January
+        dow[missing] = 0
+        month_zero[missing] = 0
 
         if config.include_day_of_week:
-            dow = dates.dt.dayofweek  # 0=Monday, 6=Sunday
             if config.use_cyclical_encoding:
-                result["dow_sin"] = np.sin(2 * np.pi * dow / 7)
-                result["dow_cos"] = np.cos(2 * np.pi * dow / 7)
-                columns.extend(["dow_sin", "dow_cos"])
+                columns["dow_sin"] = _nan_where_missing(missing, _DOW_SIN[dow])
+                columns["dow_cos"] = _nan_where_missing(missing, _DOW_COS[dow])
             else:
-                result["day_of_week"] = dow
-                columns.append("day_of_week")
+                columns["day_of_week"] = _nan_where_missing(missing, dow)
 
         if config.include_month:
-            month = dates.dt.month
             if config.use_cyclical_encoding:
-                result["month_sin"] = np.sin(2 * np.pi * month / 12)
-                result["month_cos"] = np.cos(2 * np.pi * month / 12)
-                columns.extend(["month_sin", "month_cos"])
+                columns["month_sin"] = _nan_where_missing(missing, _MONTH_SIN[month_zero])
+                columns["month_cos"] = _nan_where_missing(missing, _MONTH_COS[month_zero])
             else:
-                result["month"] = month
-                columns.append("month")
+                columns["month"] = _nan_where_missing(missing, month_zero + 1)
 
         if config.include_quarter:
-            result["quarter"] = dates.dt.quarter
-            columns.append("quarter")
+            columns["quarter"] = _nan_where_missing(missing, month_zero // 3 + 1)
 
         if config.include_year:
-            result["year"] = dates.dt.year
-            columns.append("year")
+            columns["year"] = _nan_where_missing(
+                missing, (month_index // 12 + 1970).astype(np.int16)
+            )
 
         if config.include_is_weekend:
-            result["is_weekend"] = dates.dt.dayofweek.isin([5, 6]).astype(int)
-            columns.append("is_weekend")
+            columns["is_weekend"] = ((dow >= 5) & ~missing).astype(np.uint8)
 
         if config.include_is_month_end:
-            result["is_month_end"] = dates.dt.is_month_end.astype(int)
-            columns.append("is_month_end")
+            next_day_month = (days + np.timedelta64(1, "D")).astype("datetime64[M]")
+            columns["is_month_end"] = ((next_day_month != months) & ~missing).astype(np.uint8)
 
         # is_holiday would require calendar table lookup
         # Handled separately if data is joined from Calendar table
 
-        return result, columns
+        return columns
 
-    def _apply_imputation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _apply_imputation(
+        self, df: pd.DataFrame, group_ids: np.ndarray
+    ) -> tuple[pd.DataFrame, np.ndarray]:
         """Apply configured imputation strategies.
 
         CRITICAL: Group-aware imputation to prevent cross-series leakage.
@@ -307,16 +396,20 @@ class FeatureEngineeringService:
         - "ffill" (forward fill) and "zero" are safe
 
         Args:
-            df: Input dataframe.
+            df: Input dataframe sorted by entity + date. Columns are replaced on
+                this frame (it is the sorted working copy owned by compute_features).
+            group_ids: Contiguous entity labels for df rows (see ``_group_ids``).
 
         Returns:
-            Dataframe with imputed values.
+            Tuple of (dataframe with imputed values, positions of the input
+            rows it retains).
         """
         config = self.config.imputation_config
         if config is None:
             raise RuntimeError("_apply_imputation called without imputation_config")
 
-        result = df.copy()
+        result = df
+        kept = np.arange(len(df))
 
         for col, strategy in config.strategies.items():
             if col not in result.columns:
@@ -326,7 +419,7 @@ class FeatureEngineeringService:
                 result[col] = result[col].fillna(0)
             elif strategy == "ffill":
                 # CRITICAL: Group-aware forward fill (time-safe)
-                result[col] = result.groupby(self.entity_cols, observed=True)[col].ffill()
+                result[col] = result[col].groupby(group_ids, sort=False).ffill()
             elif strategy == "bfill":
                 # WARNING: bfill uses future data — use only for debugging/testing
                 logger.warning(
@@ -335,7 +428,7 @@ class FeatureEngineeringService:
                     column=col,
                     message="bfill uses future values to fill gaps; avoid in production",
                 )
-                result[col] = result.groupby(self.entity_cols, observed=True)[col].bfill()
+                result[col] = result[col].groupby(group_ids, sort=False).bfill()
             elif strategy == "mean":
                 # WARNING: mean uses entire series including future — use only for debugging
                 logger.warning(
@@ -344,64 +437,118 @@ class FeatureEngineeringService:
                     column=col,
                     message="mean uses entire series including future values; use 'expanding_mean' instead",
                 )
-                result[col] = result.groupby(self.entity_cols, observed=True)[col].transform(
-                    lambda x: x.fillna(x.mean())
+                result[col] = result[col].fillna(
+                    result[col].groupby(group_ids, sort=False).transform("mean")
                 )
             elif strategy == "expanding_mean":
-                # TIME-SAFE: Uses only past values via expanding window
-                result[col] = result.groupby(self.entity_cols, observed=True)[col].transform(
-                    lambda x: x.fillna(x.expanding(min_periods=1).mean().shift(1))
-                )
+                # TIME-SAFE: Uses only past values via expanding window.
+                # At a missing row the group's running sum/count of observed
+                # values only cover earlier rows: expanding().mean().shift(1).
+                observed = result[col].notna().astype(np.int64)
+                running_sum = result[col].fillna(0).groupby(group_ids, sort=False).cumsum()
+                running_count = observed.groupby(group_ids, sort=False).cumsum()
+                past_mean = running_sum / running_count.where(running_count > 0)
+                result[col] = result[col].fillna(past_mean)
             elif strategy == "drop":
-                result = result.dropna(subset=[col])
+                keep = result[col].notna().to_numpy()
+                result = result[keep]
+                group_ids = group_ids[keep]
+                kept = kept[keep]
 
-        return result
+        return result, kept
 
-    def _compute_exogenous_features(self, df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+    def _compute_exogenous_features(
+        self, df: pd.DataFrame, group_ids: np.ndarray
+    ) -> FeatureColumns:
         """Compute exogenous features (price, promo, inventory).
 
         CRITICAL: All exogenous features are lagged to prevent leakage.
 
         Args:
-            df: Input dataframe with exogenous columns.
+            df: Input dataframe with exogenous columns, sorted by entity + date.
+            group_ids: Contiguous entity labels for df rows (see ``_group_ids``).
 
         Returns:
-            Tuple of (dataframe with exogenous features, list of new column names).
+            Mapping of new exogenous column name to values, aligned with df rows.
         """
         config = self.config.exogenous_config
         if config is None:
             raise RuntimeError("_compute_exogenous_features called without exogenous_config")
 
-        result = df.copy()
-        columns: list[str] = []
+        columns: FeatureColumns = {}
 
         # Price features (if price column exists)
         if config.include_price and "unit_price" in df.columns:
+            prices = df["unit_price"].to_numpy(dtype=np.float64, na_value=np.nan)
             for lag in config.price_lags:
-                col_name = f"price_lag_{lag}"
-                result[col_name] = df.groupby(self.entity_cols, observed=True)["unit_price"].shift(
-                    lag
-                )
-                columns.append(col_name)
+                columns[f"price_lag_{lag}"] = _shift_within_groups(prices, group_ids, lag)
 
             if config.include_price_change:
                 # CRITICAL: shift(1) before pct_change to prevent using current price
                 # This computes: (price[t-1] - price[t-8]) / price[t-8]
                 # Without shift(1), it would use current price at t, causing leakage
-                result["price_pct_change_7d"] = df.groupby(self.entity_cols, observed=True)[
-                    "unit_price"
-                ].transform(lambda x: x.shift(1).pct_change(periods=7))
-                columns.append("price_pct_change_7d")
+                previous = _shift_within_groups(prices, group_ids, 1)
+                base = _shift_within_groups(prices, group_ids, 8)
+                # Same arithmetic as pct_change: zero base prices give inf/NaN
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    columns["price_pct_change_7d"] = previous / base - 1
 
         # Stockout flag (if inventory column exists)
         if config.include_stockout_flag and "is_stockout" in df.columns:
             # Lagged stockout flag (yesterday's stockout)
-            result["stockout_lag_1"] = df.groupby(self.entity_cols, observed=True)[
-                "is_stockout"
-            ].shift(1)
-            columns.append("stockout_lag_1")
+            columns["stockout_lag_1"] = (
+                df["is_stockout"].groupby(group_ids, sort=False).shift(1).to_numpy()
+            )
+
+        return columns
+
+
+# Rows fetched per partition when streaming bulk sales loads
+_STREAM_PARTITION_ROWS = 50_000
+
+_SALES_COLUMNS = ["date", "store_id", "product_id", "quantity", "unit_price", "total_amount"]
+
+
+def _sales_frame(rows: Sequence[Any]) -> pd.DataFrame:
+    """Build the sales dataframe from result rows in ``_SALES_COLUMNS`` order.
+
+    Args:
+        rows: Result rows (tuples in select order).
+
+    Returns:
+        DataFrame with sales data; prices cast from Decimal to float.
+    """
+    if not rows:
+        return pd.DataFrame(columns=_SALES_COLUMNS)
+
+    # Rows are tuples in select order: build the frame from them directly
+    # instead of allocating a dict per row, then cast Decimal columns once
+    df = pd.DataFrame(rows, columns=_SALES_COLUMNS)
+    df["unit_price"] = df["unit_price"].astype(np.float64)
+    df["total_amount"] = df["total_amount"].astype(np.float64)
+    return df
+
+
+async def _stream_sales_frame(db: AsyncSession, stmt: Select[Any]) -> pd.DataFrame:
+    """Run a sales query and build its dataframe partition by partition.
 
-        return result, columns
+    Only one partition of Row objects is alive at a time; each becomes a
+    compact frame before the next is fetched.
+
+    Args:
+        db: Async database session.
+        stmt: Select returning columns in ``_SALES_COLUMNS`` order.
+
+    Returns:
+        DataFrame with sales data in query order.
+    """
+    result = await db.stream(stmt.execution_options(yield_per=_STREAM_PARTITION_ROWS))
+    frames = [_sales_frame(rows) async for rows in result.partitions()]
+    if not frames:
+        return _sales_frame([])
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
 
 
 class FeatureDataLoader:
@@ -448,28 +595,49 @@ class FeatureDataLoader:
             .order_by(SalesDaily.date)
         )
 
-        result = await db.execute(stmt)
-        rows = result.all()
+        return await _stream_sales_frame(db, stmt)
 
-        if not rows:
-            return pd.DataFrame(
-                columns=["date", "store_id", "product_id", "quantity", "unit_price", "total_amount"]
-            )
+    async def load_sales_data_bulk(
+        self,
+        db: AsyncSession,
+        series: Sequence[tuple[int, int]],
+        start_date: date_type,
+        end_date: date_type,
+    ) -> pd.DataFrame:
+        """Load sales data for several series in a single query.
 
-        return pd.DataFrame(
-            [
-                {
-                    "date": row.date,
-                    "store_id": row.store_id,
-                    "product_id": row.product_id,
-                    "quantity": row.quantity,
-                    "unit_price": float(row.unit_price),
-                    "total_amount": float(row.total_amount),
-                }
-                for row in rows
-            ]
+        Args:
+            db: Async database session.
+            series: (store_id, product_id) pairs to load.
+            start_date: Start date (inclusive).
+            end_date: End date (inclusive).
+
+        Returns:
+            DataFrame with sales data for all series, ordered by entity + date.
+            Callers can partition it with ``groupby(["store_id", "product_id"])``.
+        """
+        if not series:
+            return _sales_frame([])
+
+        stmt = (
+            select(
+                SalesDaily.date,
+                SalesDaily.store_id,
+                SalesDaily.product_id,
+                SalesDaily.quantity,
+                SalesDaily.unit_price,
+                SalesDaily.total_amount,
+            )
+            .where(
+                tuple_(SalesDaily.store_id, SalesDaily.product_id).in_(list(series))
+                & (SalesDaily.date >= start_date)
+                & (SalesDaily.date <= end_date)
+            )
+            .order_by(SalesDaily.store_id, SalesDaily.product_id, SalesDaily.date)
         )
 
+        return await _stream_sales_frame(db, stmt)
+
     async def load_calendar_data(
         self,
         db: AsyncSession,
@@ -516,19 +684,18 @@ class FeatureDataLoader:
                 ]
             )
 
+        # Rows are tuples in select order: no per-row dict allocation
         return pd.DataFrame(
-            [
-                {
-                    "date": row.date,
-                    "day_of_week": row.day_of_week,
-                    "month": row.month,
-                    "quarter": row.quarter,
-                    "year": row.year,
-                    "is_holiday": row.is_holiday,
-                    "holiday_name": row.holiday_name,
-                }
-                for row in rows
-            ]
+            rows,
+            columns=[
+                "date",
+                "day_of_week",
+                "month",
+                "quarter",
+                "year",
+                "is_holiday",
+                "holiday_name",
+            ],
         )
 
 
@@ -570,19 +737,85 @@ async def compute_features_for_series(
     )
 
     # Optionally load and merge calendar data
-    if config.calendar_config and config.calendar_config.include_is_holiday:
-        calendar_df = await loader.load_calendar_data(
-            db=db,
-            start_date=start_date,
-            end_date=cutoff_date,
-        )
-        if not calendar_df.empty and not df.empty:
-            df = df.merge(
-                calendar_df[["date", "is_holiday"]],
-                on="date",
-                how="left",
-            )
+    df = await _merge_holidays(loader, db, df, config, start_date, cutoff_date)
 
     # Compute features
     service = FeatureEngineeringService(config)
     return service.compute_features(df, cutoff_date=cutoff_date)
+
+
+async def compute_features_for_many_series(
+    db: AsyncSession,
+    series: Sequence[tuple[int, int]],
+    cutoff_date: date_type,
+    lookback_days: int,
+    config: FeatureSetConfig,
+) -> FeatureComputationResult:
+    """Compute features for several series at once.
+
+    Loads every series with one query and runs the pipeline once over the
+    combined frame. All steps are already group-aware and vectorized across
+    entities, so this replaces N load + compute round-trips.
+
+    Args:
+        db: Async database session.
+        series: (store_id, product_id) pairs to compute.
+        cutoff_date: Maximum date to include.
+        lookback_days: Days of history to use.
+        config: Feature set configuration.
+
+    Returns:
+        FeatureComputationResult with rows for all series, ordered by entity + date.
+    """
+    loader = FeatureDataLoader()
+    start_date = cutoff_date - timedelta(days=lookback_days)
+
+    df = await loader.load_sales_data_bulk(
+        db=db,
+        series=series,
+        start_date=start_date,
+        end_date=cutoff_date,
+    )
+    df = await _merge_holidays(loader, db, df, config, start_date, cutoff_date)
+
+    service = FeatureEngineeringService(config)
+    return service.compute_features(df, cutoff_date=cutoff_date)
+
+
+async def _merge_holidays(
+    loader: FeatureDataLoader,
+    db: AsyncSession,
+    df: pd.DataFrame,
+    config: FeatureSetConfig,
+    start_date: date_type,
+    end_date: date_type,
+) -> pd.DataFrame:
+    """Join the calendar is_holiday flag onto sales data when configured.
+
+    Args:
+        loader: Data loader.
+        db: Async database session.
+        df: Sales data.
+        config: Feature set configuration.
+        start_date: Start date (inclusive).
+        end_date: End date (inclusive).
+
+    Returns:
+        Sales data, with an is_holiday column if holidays are enabled.
+    """
+    if not (config.calendar_config and config.calendar_config.include_is_holiday):
+        return df
+
+    calendar_df = await loader.load_calendar_data(
+        db=db,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    if calendar_df.empty or df.empty:
+        return df
+
+    return df.merge(
+        calendar_df[["date", "is_holiday"]],
+        on="date",
+        how="left",
+    )
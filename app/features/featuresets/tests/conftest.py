@@ -1,5 +1,6 @@
 """Test fixtures for featuresets module."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -13,51 +14,65 @@ from app.features.featuresets.schemas import (
 )
 
 
-@pytest.fixture
-def sample_time_series() -> pd.DataFrame:
-    """Create sample time series data for testing.
+@pytest.fixture(scope="session")
+def shared_time_series() -> pd.DataFrame:
+    """Create the sample time series once per session for read-only use.
 
-    Returns 30 days of data for a single store/product with sequential
-    quantity values (1, 2, 3, ...) for easy leakage detection.
+    Backs fixtures that share one computed result across tests; tests that
+    modify data should use ``sample_time_series`` instead.
     """
-    dates = pd.date_range(start="2024-01-01", periods=30, freq="D")
+    n_days = 30
+    quantity = np.arange(1, n_days + 1, dtype=np.int64)  # Sequential for leakage detection
     return pd.DataFrame(
         {
-            "date": dates,
-            "store_id": [1] * 30,
-            "product_id": [1] * 30,
-            "quantity": list(range(1, 31)),  # Sequential for leakage detection
-            "unit_price": [10.0] * 30,
-            "total_amount": [q * 10.0 for q in range(1, 31)],
+            "date": pd.date_range(start="2024-01-01", periods=n_days, freq="D"),
+            "store_id": np.ones(n_days, dtype=np.int64),
+            "product_id": np.ones(n_days, dtype=np.int64),
+            "quantity": quantity,
+            "unit_price": np.full(n_days, 10.0),
+            "total_amount": quantity * 10.0,
         }
     )
 
 
 @pytest.fixture
+def sample_time_series(shared_time_series: pd.DataFrame) -> pd.DataFrame:
+    """Create sample time series data for testing.
+
+    Returns 30 days of data for a single store/product with sequential
+    quantity values (1, 2, 3, ...) for easy leakage detection.
+    """
+    return shared_time_series.copy()
+
+
+@pytest.fixture(scope="session")
 def multi_series_time_series() -> pd.DataFrame:
     """Create sample time series with multiple series.
 
-    Returns data for 2 stores x 2 products to test group isolation.
+    Returns data for 2 stores x 2 products to test group isolation. Built once
+    per session and shared, so tests must copy it before modifying it.
     """
-    dates = pd.date_range(start="2024-01-01", periods=10, freq="D")
-    rows = []
-
-    for store_id in [1, 2]:
-        for product_id in [1, 2]:
-            base = (store_id - 1) * 100 + (product_id - 1) * 10
-            for i, d in enumerate(dates):
-                rows.append(
-                    {
-                        "date": d,
-                        "store_id": store_id,
-                        "product_id": product_id,
-                        "quantity": base + i + 1,  # Unique per series
-                        "unit_price": 10.0 + store_id,
-                        "total_amount": (base + i + 1) * (10.0 + store_id),
-                    }
-                )
-
-    return pd.DataFrame(rows)
+    n_days = 10
+    dates = pd.date_range(start="2024-01-01", periods=n_days, freq="D")
+
+    # Rows ordered store -> product -> date, built column by column
+    store_id = np.repeat(np.array([1, 2], dtype=np.int64), 2 * n_days)
+    product_id = np.tile(np.repeat(np.array([1, 2], dtype=np.int64), n_days), 2)
+    day_index = np.tile(np.arange(n_days, dtype=np.int64), 4)
+    base = (store_id - 1) * 100 + (product_id - 1) * 10
+    quantity = base + day_index + 1  # Unique per series
+    unit_price = 10.0 + store_id
+
+    return pd.DataFrame(
+        {
+            "date": np.tile(dates, 4),
+            "store_id": store_id,
+            "product_id": product_id,
+            "quantity": quantity,
+            "unit_price": unit_price,
+            "total_amount": quantity * unit_price,
+        }
+    )
 
 
 @pytest.fixture
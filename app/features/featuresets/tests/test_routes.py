@@ -0,0 +1,226 @@
+"""Unit tests for featuresets route helpers."""
+
+import json
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import OperationalError
+
+from app.core.exceptions import DatabaseError, NotFoundError
+from app.features.featuresets import routes
+from app.features.featuresets.routes import (
+    _build_feature_columns,
+    _build_feature_rows,
+    _feature_values,
+    _iter_feature_rows_ndjson,
+    _load_features,
+)
+from app.features.featuresets.schemas import (
+    CalendarConfig,
+    ComputeFeaturesRequest,
+    FeatureRow,
+    FeatureSetConfig,
+    LagConfig,
+)
+from app.features.featuresets.service import FeatureComputationResult, FeatureEngineeringService
+
+
+class TestBuildFeatureRows:
+    """Tests for dataframe to FeatureRow conversion."""
+
+    def test_converts_computed_features(self, sample_time_series):
+        """Rows should carry dates, ids and JSON-ready feature values."""
+        config = FeatureSetConfig(
+            name="test",
+            lag_config=LagConfig(lags=(1,)),
+            calendar_config=CalendarConfig(use_cyclical_encoding=False),
+        )
+        result = FeatureEngineeringService(config).compute_features(sample_time_series)
+
+        rows = _build_feature_rows(result.df, result.feature_columns, "date")
+
+        assert len(rows) == 30
+        assert rows[0].date == date(2024, 1, 1)
+        assert rows[0].store_id == 1
+        assert rows[0].product_id == 1
+        # NaN becomes None
+        assert rows[0].features["lag_1"] is None
+        assert rows[1].features["lag_1"] == 1.0
+        assert isinstance(rows[1].features["lag_1"], float)
+        # Integer and boolean-derived columns stay ints
+        assert rows[0].features["day_of_week"] == 0
+        assert isinstance(rows[0].features["is_weekend"], int)
+
+    def test_constructed_rows_match_validated_rows(self, sample_time_series):
+        """Rows built without validation should equal their validated form."""
+        config = FeatureSetConfig(name="test", lag_config=LagConfig(lags=(1, 7)))
+        result = FeatureEngineeringService(config).compute_features(sample_time_series)
+
+        rows = _build_feature_rows(result.df, result.feature_columns, "date")
+
+        for row in rows:
+            assert FeatureRow.model_validate(row.model_dump()) == row
+
+    def test_accepts_python_date_column(self):
+        """Object columns of python dates (as loaded from the DB) are supported."""
+        df = pd.DataFrame(
+            {
+                "date": [date(2024, 1, 1), date(2024, 1, 2)],
+                "store_id": [1, 1],
+                "product_id": [2, 2],
+                "lag_1": [None, 5],
+            }
+        )
+
+        rows = _build_feature_rows(df, ["lag_1"], "date")
+
+        assert [row.date for row in rows] == [date(2024, 1, 1), date(2024, 1, 2)]
+        assert rows[0].features == {"lag_1": None}
+        assert rows[1].features == {"lag_1": 5.0}
+
+    def test_invalid_store_id_raises(self):
+        """A non-positive store_id should be rejected with HTTP 400."""
+        df = pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=2, freq="D"),
+                "store_id": [1, 0],
+                "product_id": [1, 1],
+            }
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            _build_feature_rows(df, [], "date")
+
+        assert exc_info.value.status_code == 400
+        assert "store_id" in exc_info.value.detail
+
+    def test_missing_product_id_raises(self):
+        """A missing product_id should be rejected with HTTP 400."""
+        df = pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=2, freq="D"),
+                "store_id": [1, 1],
+                "product_id": [1, None],
+            }
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            _build_feature_rows(df, [], "date")
+
+        assert exc_info.value.status_code == 400
+        assert "product_id" in exc_info.value.detail
+
+
+class TestBuildFeatureColumns:
+    """Tests for dataframe to columnar feature conversion."""
+
+    def test_columns_match_row_layout(self, sample_time_series):
+        """Column lists should hold the same values as the per-row layout."""
+        config = FeatureSetConfig(name="test", lag_config=LagConfig(lags=(1, 7)))
+        result = FeatureEngineeringService(config).compute_features(sample_time_series)
+
+        columns = _build_feature_columns(result.df, result.feature_columns)
+        rows = _build_feature_rows(result.df, result.feature_columns, "date")
+
+        assert list(columns) == result.feature_columns
+        for col in result.feature_columns:
+            assert columns[col] == [row.features[col] for row in rows]
+
+
+class TestFeatureValues:
+    """Tests for per-column conversion to JSON-ready values."""
+
+    def test_float_column_maps_nan_to_none(self):
+        """NaN in a float column should become None."""
+        assert _feature_values(pd.Series([1.5, float("nan"), 2.0])) == [1.5, None, 2.0]
+
+    def test_object_column_keeps_only_numeric_values(self):
+        """Strings in object columns, numeric or not, should become None."""
+        values = pd.Series([1, 2.5, "3", "abc", None, float("nan")], dtype=object)
+
+        assert _feature_values(values) == [1, 2.5, None, None, None, None]
+
+
+class TestIterFeatureRowsNdjson:
+    """Tests for NDJSON streaming of feature rows."""
+
+    def test_streams_one_line_per_row_across_chunks(self, sample_time_series):
+        """Every row should be emitted exactly once regardless of chunk size."""
+        config = FeatureSetConfig(name="test", lag_config=LagConfig(lags=(1,)))
+        result = FeatureEngineeringService(config).compute_features(sample_time_series)
+
+        lines = list(
+            _iter_feature_rows_ndjson(result.df, result.feature_columns, "date", chunk_rows=7)
+        )
+
+        assert len(lines) == 30
+        assert all(line.endswith(b"\n") for line in lines)
+        first = json.loads(lines[0])
+        assert first == {
+            "date": "2024-01-01",
+            "store_id": 1,
+            "product_id": 1,
+            "features": {"lag_1": None},
+        }
+        assert json.loads(lines[-1])["features"]["lag_1"] == 29.0
+
+
+class TestLoadFeatures:
+    """Tests for the request handling shared by the feature routes."""
+
+    @staticmethod
+    def _request() -> ComputeFeaturesRequest:
+        return ComputeFeaturesRequest(
+            store_id=1,
+            product_id=2,
+            cutoff_date=date(2024, 1, 31),
+            config=FeatureSetConfig(name="test", lag_config=LagConfig(lags=(1,))),
+        )
+
+    async def test_returns_computed_result(self, monkeypatch, sample_time_series):
+        """A non-empty computation should be returned unchanged."""
+        config = FeatureSetConfig(name="test", lag_config=LagConfig(lags=(1,)))
+        expected = FeatureEngineeringService(config).compute_features(sample_time_series)
+
+        async def fake_compute(**_kwargs):
+            return expected
+
+        monkeypatch.setattr(routes, "compute_features_for_series", fake_compute)
+
+        result = await _load_features(self._request(), AsyncMock(), "featureops.compute", 30)
+
+        assert result is expected
+
+    async def test_empty_result_raises_not_found(self, monkeypatch):
+        """A series with no rows in the window should raise NotFoundError."""
+        empty = FeatureComputationResult(
+            df=pd.DataFrame(), feature_columns=[], config_hash="x", stats={}
+        )
+
+        async def fake_compute(**_kwargs):
+            return empty
+
+        monkeypatch.setattr(routes, "compute_features_for_series", fake_compute)
+
+        with pytest.raises(NotFoundError, match="store_id=1, product_id=2"):
+            await _load_features(self._request(), AsyncMock(), "featureops.compute", 30)
+
+    async def test_sql_error_raises_database_error(self, monkeypatch):
+        """SQLAlchemy failures should surface as DatabaseError with the given message."""
+
+        async def fake_compute(**_kwargs):
+            raise OperationalError("SELECT 1", {}, Exception("down"))
+
+        monkeypatch.setattr(routes, "compute_features_for_series", fake_compute)
+
+        with pytest.raises(DatabaseError, match="Failed to preview features"):
+            await _load_features(
+                self._request(),
+                AsyncMock(),
+                "featureops.preview",
+                365,
+                failure_message="Failed to preview features",
+            )
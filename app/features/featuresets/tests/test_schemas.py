@@ -1,5 +1,6 @@
 """Unit tests for feature engineering schemas."""
 
+import hashlib
 from datetime import date
 
 import pytest
@@ -15,6 +16,8 @@ from app.features.featuresets.schemas import (
     RollingConfig,
 )
 
+pytestmark = pytest.mark.schemas
+
 
 class TestLagConfig:
     """Tests for LagConfig validation."""
@@ -29,21 +32,21 @@ class TestLagConfig:
         with pytest.raises(ValidationError) as exc_info:
             LagConfig(lags=(-1, 7))
 
-        assert "positive integers" in str(exc_info.value).lower()
+        assert exc_info.value.errors()[0]["type"] == "greater_than"
 
     def test_rejects_zero_lag(self):
         """Zero lag should be rejected (current row is not a lag)."""
         with pytest.raises(ValidationError) as exc_info:
             LagConfig(lags=(0, 7))
 
-        assert "positive integers" in str(exc_info.value).lower()
+        assert exc_info.value.errors()[0]["type"] == "greater_than"
 
     def test_rejects_empty_lags(self):
         """Empty lags tuple should be rejected."""
         with pytest.raises(ValidationError) as exc_info:
             LagConfig(lags=())
 
-        assert "at least one lag" in str(exc_info.value).lower()
+        assert exc_info.value.errors()[0]["type"] == "too_short"
 
     def test_default_values(self):
         """Default values should be set correctly."""
@@ -67,14 +70,14 @@ class TestRollingConfig:
         with pytest.raises(ValidationError) as exc_info:
             RollingConfig(windows=(-7, 14))
 
-        assert "positive integers" in str(exc_info.value).lower()
+        assert exc_info.value.errors()[0]["type"] == "greater_than"
 
     def test_rejects_empty_windows(self):
         """Empty windows tuple should be rejected."""
         with pytest.raises(ValidationError) as exc_info:
             RollingConfig(windows=())
 
-        assert "at least one window" in str(exc_info.value).lower()
+        assert exc_info.value.errors()[0]["type"] == "too_short"
 
     def test_valid_aggregations(self):
         """Valid aggregation functions should be accepted."""
@@ -112,7 +115,7 @@ class TestExogenousConfig:
         with pytest.raises(ValidationError) as exc_info:
             ExogenousConfig(price_lags=(-7, 14))
 
-        assert "positive integers" in str(exc_info.value).lower()
+        assert exc_info.value.errors()[0]["type"] == "greater_than"
 
 
 class TestImputationConfig:
@@ -198,6 +201,14 @@ class TestFeatureSetConfig:
         )
         assert config1.config_hash() != config2.config_hash()
 
+    def test_config_hash_is_truncated_sha256_of_json(self):
+        """config_hash should stay a truncated SHA-256 of the config JSON."""
+        config = FeatureSetConfig(name="test", lag_config=LagConfig(lags=(1, 7)))
+
+        expected = hashlib.sha256(config.model_dump_json().encode()).hexdigest()[:16]
+
+        assert config.config_hash() == expected
+
     def test_config_is_frozen(self):
         """Config should be immutable (frozen)."""
         config = FeatureSetConfig(name="test")
@@ -1,18 +1,27 @@
 """Unit tests for FeatureEngineeringService."""
 
 from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from app.features.featuresets.schemas import (
     CalendarConfig,
+    ExogenousConfig,
     FeatureSetConfig,
     ImputationConfig,
     LagConfig,
     RollingConfig,
 )
-from app.features.featuresets.service import FeatureEngineeringService
+from app.features.featuresets.service import (
+    FeatureDataLoader,
+    FeatureEngineeringService,
+    compute_features_for_many_series,
+)
 
 
 class TestLagFeatures:
@@ -46,14 +55,11 @@ class TestLagFeatures:
         result = service.compute_features(sample_time_series)
 
         # First 7 rows should have NaN
-        for i in range(7):
-            assert pd.isna(result.df.iloc[i]["lag_7"])
-
-        # Row 8 (index 7) should have value from row 1 (index 0)
-        assert result.df.iloc[7]["lag_7"] == 1
+        assert result.df["lag_7"].iloc[:7].isna().all()
 
-        # Row 15 (index 14) should have value from row 8 (index 7)
-        assert result.df.iloc[14]["lag_7"] == 8
+        # Row 8 (index 7) should have value from row 1 (index 0);
+        # row 15 (index 14) should have value from row 8 (index 7)
+        np.testing.assert_array_equal(result.df["lag_7"].to_numpy()[[7, 14]], [1, 8])
 
     def test_multiple_lags(self, sample_time_series):
         """Multiple lags should be computed correctly."""
@@ -80,6 +86,18 @@ class TestLagFeatures:
         # First row should have 0 instead of NaN
         assert result.df.iloc[0]["lag_1"] == 0.0
 
+    def test_lags_match_groupby_shift(self, multi_series_time_series):
+        """Vectorized lags should equal groupby.shift on shuffled multi-series input."""
+        df = multi_series_time_series.sample(frac=1, random_state=0)
+        config = FeatureSetConfig(name="test", lag_config=LagConfig(lags=(1, 3, 12)))
+
+        result = FeatureEngineeringService(config).compute_features(df).df
+
+        grouped = result.groupby(["store_id", "product_id"])["quantity"]
+        for lag in (1, 3, 12):
+            expected = grouped.shift(lag)
+            pd.testing.assert_series_equal(result[f"lag_{lag}"], expected, check_names=False)
+
 
 class TestRollingFeatures:
     """Tests for rolling feature computation."""
@@ -98,16 +116,13 @@ class TestRollingFeatures:
         result = service.compute_features(sample_time_series)
 
         # First 7 rows should have NaN (shift(1) + 7-day window)
-        for i in range(7):
-            assert pd.isna(result.df.iloc[i]["rolling_mean_7"])
+        assert result.df["rolling_mean_7"].iloc[:7].isna().all()
 
         # Row 8 (index 7) should have mean of rows 1-7 (indices 0-6)
         # Values: 1, 2, 3, 4, 5, 6, 7 -> mean = 4.0
-        assert result.df.iloc[7]["rolling_mean_7"] == pytest.approx(4.0)
-
         # Row 9 (index 8) should have mean of rows 2-8 (indices 1-7)
         # Values: 2, 3, 4, 5, 6, 7, 8 -> mean = 5.0
-        assert result.df.iloc[8]["rolling_mean_7"] == pytest.approx(5.0)
+        np.testing.assert_allclose(result.df["rolling_mean_7"].iloc[7:9].to_numpy(), [4.0, 5.0])
 
     def test_rolling_std_computation(self, sample_time_series):
         """Rolling std should be computed correctly."""
@@ -144,6 +159,27 @@ class TestRollingFeatures:
         assert "rolling_min_7" in result.feature_columns
         assert "rolling_max_7" in result.feature_columns
 
+    def test_rolling_matches_groupby_transform(self, multi_series_time_series):
+        """Grouped rolling should equal a per-entity shift(1).rolling() transform."""
+        config = FeatureSetConfig(
+            name="test",
+            rolling_config=RollingConfig(
+                windows=(3, 5), aggregations=("mean", "std", "min", "max", "sum"), min_periods=2
+            ),
+        )
+
+        result = FeatureEngineeringService(config).compute_features(multi_series_time_series).df
+
+        grouped = result.groupby(["store_id", "product_id"])["quantity"]
+        for window in (3, 5):
+            for agg in ("mean", "std", "min", "max", "sum"):
+                expected = grouped.transform(
+                    lambda x, w=window, a=agg: x.shift(1).rolling(w, min_periods=2).agg(a)
+                )
+                pd.testing.assert_series_equal(
+                    result[f"rolling_{agg}_{window}"], expected, check_names=False
+                )
+
 
 class TestCalendarFeatures:
     """Tests for calendar feature computation."""
@@ -213,6 +249,50 @@ class TestCalendarFeatures:
         # January data should be Q1
         assert (result.df["quarter"] == 1).all()
 
+    def test_calendar_matches_dt_accessors(self):
+        """Epoch arithmetic should match the pandas .dt accessors across years."""
+        dates = pd.date_range("1968-12-25", "2025-03-05", freq="17D")
+        df = pd.DataFrame({"date": dates, "store_id": 1, "product_id": 1, "quantity": 1.0})
+        config = FeatureSetConfig(
+            name="test",
+            calendar_config=CalendarConfig(use_cyclical_encoding=False, include_year=True),
+        )
+
+        result = FeatureEngineeringService(config).compute_features(df).df
+
+        assert (result["day_of_week"] == dates.dayofweek).all()
+        assert (result["month"] == dates.month).all()
+        assert (result["quarter"] == dates.quarter).all()
+        assert (result["year"] == dates.year).all()
+        assert (result["is_weekend"] == dates.dayofweek.isin([5, 6]).astype(int)).all()
+        assert (result["is_month_end"] == dates.is_month_end.astype(int)).all()
+
+
+class TestExogenousFeatures:
+    """Tests for exogenous feature computation."""
+
+    def test_price_features_match_groupby_reference(self, multi_series_time_series):
+        """Price lags and pct change should match the per-group pandas definitions."""
+        df = multi_series_time_series.copy()
+        df["unit_price"] = [float(i % 5) for i in range(len(df))]  # includes zeros
+        df.loc[[3, 25], "unit_price"] = None
+        config = FeatureSetConfig(
+            name="test",
+            exogenous_config=ExogenousConfig(price_lags=(1, 7), include_stockout_flag=False),
+        )
+        service = FeatureEngineeringService(config)
+        result = service.compute_features(df.sample(frac=1, random_state=0))
+
+        grouped = result.df.groupby(["store_id", "product_id"])["unit_price"]
+        for lag in (1, 7):
+            pd.testing.assert_series_equal(
+                result.df[f"price_lag_{lag}"], grouped.shift(lag), check_names=False
+            )
+        expected = grouped.transform(lambda x: x.shift(1).pct_change(periods=7))
+        pd.testing.assert_series_equal(
+            result.df["price_pct_change_7d"], expected, check_names=False
+        )
+
 
 class TestImputation:
     """Tests for imputation strategies."""
@@ -247,6 +327,29 @@ class TestImputation:
         non_null_count = result.df["unit_price"].notna().sum()
         assert non_null_count >= len(result.df) - 1
 
+    @pytest.mark.parametrize(
+        ("strategy", "reference"),
+        [
+            ("expanding_mean", lambda x: x.fillna(x.expanding(min_periods=1).mean().shift(1))),
+            ("mean", lambda x: x.fillna(x.mean())),
+        ],
+    )
+    def test_mean_strategies_match_per_group_reference(
+        self, multi_series_time_series, strategy, reference
+    ):
+        """Vectorized mean imputation should match the per-group pandas expression."""
+        df = multi_series_time_series.astype({"quantity": float})
+        df.loc[[0, 3, 4, 10, 25, 39], "quantity"] = None
+        expected = df.groupby(["store_id", "product_id"])["quantity"].transform(reference)
+        config = FeatureSetConfig(
+            name="test",
+            imputation_config=ImputationConfig(strategies={"quantity": strategy}),
+        )
+
+        result = FeatureEngineeringService(config).compute_features(df).df
+
+        pd.testing.assert_series_equal(result["quantity"], expected)
+
 
 class TestCutoffEnforcement:
     """Tests for cutoff date enforcement."""
@@ -273,6 +376,48 @@ class TestCutoffEnforcement:
 
         assert len(result.df) == 30
 
+    def test_cutoff_after_last_date_keeps_all_rows(self, sample_time_series):
+        """A cutoff past the data should keep every row without touching the input."""
+        original = sample_time_series.copy()
+        config = FeatureSetConfig(name="test", lag_config=LagConfig(lags=(1,)))
+        service = FeatureEngineeringService(config)
+        result = service.compute_features(sample_time_series, cutoff_date=date(2025, 1, 1))
+
+        assert len(result.df) == 30
+        pd.testing.assert_frame_equal(sample_time_series, original)
+
+    def test_cutoff_accepts_python_date_column(self, sample_time_series):
+        """Object columns of datetime.date should be filtered like datetime64 ones."""
+        df = sample_time_series.assign(date=sample_time_series["date"].dt.date)
+        config = FeatureSetConfig(name="test")
+        service = FeatureEngineeringService(config)
+        result = service.compute_features(df, cutoff_date=date(2024, 1, 15))
+
+        assert len(result.df) == 15
+        assert result.df["date"].iloc[-1] == date(2024, 1, 15)
+
+    def test_calendar_aligned_after_drop_imputation(self, time_series_with_gaps):
+        """Calendar values should follow their rows when imputation drops some."""
+        config = FeatureSetConfig(
+            name="test",
+            imputation_config=ImputationConfig(strategies={"quantity": "drop"}),
+            calendar_config=CalendarConfig(
+                include_day_of_week=True,
+                use_cyclical_encoding=False,
+                include_month=False,
+                include_quarter=False,
+                include_year=False,
+                include_is_weekend=False,
+                include_is_month_end=False,
+            ),
+        )
+        service = FeatureEngineeringService(config)
+        result = service.compute_features(time_series_with_gaps, cutoff_date=date(2024, 1, 12))
+
+        assert result.df["quantity"].notna().all()
+        expected = pd.to_datetime(result.df["date"]).dt.dayofweek
+        assert result.df["day_of_week"].tolist() == expected.tolist()
+
 
 class TestComputeFeatures:
     """Integration tests for compute_features."""
@@ -317,3 +462,113 @@ class TestComputeFeatures:
 
         assert len(result.df) == 0
         assert result.feature_columns == ["lag_1"]
+
+
+class TestFeatureDataLoader:
+    """Tests for FeatureDataLoader frame construction."""
+
+    async def test_load_sales_data_builds_typed_frame(self):
+        """Row tuples should map to columns with Decimal prices cast to float."""
+        rows = [
+            (date(2024, 1, 1), 1, 2, 3, Decimal("1.50"), Decimal("4.50")),
+            (date(2024, 1, 2), 1, 2, 4, Decimal("2.25"), Decimal("9.00")),
+        ]
+        db = _streaming_db([rows])
+
+        df = await FeatureDataLoader().load_sales_data(
+            db, store_id=1, product_id=2, start_date=date(2024, 1, 1), end_date=date(2024, 1, 2)
+        )
+
+        assert list(df.columns) == [
+            "date",
+            "store_id",
+            "product_id",
+            "quantity",
+            "unit_price",
+            "total_amount",
+        ]
+        assert df["date"].tolist() == [date(2024, 1, 1), date(2024, 1, 2)]
+        assert df["quantity"].tolist() == [3, 4]
+        assert df["unit_price"].dtype == "float64"
+        assert df["total_amount"].tolist() == [4.5, 9.0]
+
+    async def test_load_sales_data_bulk_empty_series_skips_query(self):
+        """No series should return an empty frame without touching the database."""
+        db = AsyncMock()
+
+        df = await FeatureDataLoader().load_sales_data_bulk(
+            db, series=[], start_date=date(2024, 1, 1), end_date=date(2024, 1, 2)
+        )
+
+        assert df.empty
+        assert "unit_price" in df.columns
+        db.execute.assert_not_called()
+
+    async def test_load_sales_data_bulk_concatenates_partitions(self):
+        """Streamed partitions should be stitched into one contiguous frame."""
+        rows = [
+            (date(2024, 1, 1), 1, 2, 3, Decimal("1.50"), Decimal("4.50")),
+            (date(2024, 1, 2), 1, 2, 4, Decimal("2.25"), Decimal("9.00")),
+            (date(2024, 1, 1), 5, 6, 7, Decimal("1.00"), Decimal("7.00")),
+        ]
+        db = _streaming_db([rows[:2], rows[2:]])
+
+        df = await FeatureDataLoader().load_sales_data_bulk(
+            db, series=[(1, 2), (5, 6)], start_date=date(2024, 1, 1), end_date=date(2024, 1, 2)
+        )
+
+        assert df.index.tolist() == [0, 1, 2]
+        assert df["store_id"].tolist() == [1, 1, 5]
+        assert df["unit_price"].tolist() == [1.5, 2.25, 1.0]
+        assert df["unit_price"].dtype == "float64"
+
+
+def _streaming_db(partitions: list[list[tuple[Any, ...]]]) -> AsyncMock:
+    """Build a mock session whose stream() yields the given row partitions."""
+
+    async def _partitions(_size: int | None = None):
+        for partition in partitions:
+            yield partition
+
+    db = AsyncMock()
+    db.stream = AsyncMock(return_value=MagicMock(partitions=_partitions))
+    return db
+
+
+class TestComputeFeaturesForManySeries:
+    """Tests for multi-series feature computation."""
+
+    async def test_matches_per_series_computation(self):
+        """One bulk computation should equal computing each series on its own."""
+        dates = pd.date_range("2024-01-01", periods=10, freq="D").date
+        rows = [
+            (d, store, product, i + store * 10, Decimal("1.00"), Decimal("1.00"))
+            for store, product in [(1, 1), (2, 3)]
+            for i, d in enumerate(dates)
+        ]
+        db = _streaming_db([rows])
+        config = FeatureSetConfig(
+            name="test",
+            lag_config=LagConfig(lags=(1, 2)),
+            rolling_config=RollingConfig(windows=(3,), aggregations=("mean",)),
+        )
+
+        result = await compute_features_for_many_series(
+            db, series=[(1, 1), (2, 3)], cutoff_date=dates[-1], lookback_days=30, config=config
+        )
+
+        db.stream.assert_awaited_once()
+        frame = pd.DataFrame(
+            rows,
+            columns=["date", "store_id", "product_id", "quantity", "unit_price", "total_amount"],
+        )
+        service = FeatureEngineeringService(config)
+        for (store, product), group in frame.groupby(["store_id", "product_id"]):
+            expected = service.compute_features(group.reset_index(drop=True))
+            actual = result.df[
+                (result.df["store_id"] == store) & (result.df["product_id"] == product)
+            ].reset_index(drop=True)
+            pd.testing.assert_frame_equal(
+                actual[expected.feature_columns].astype(float),
+                expected.df[expected.feature_columns].astype(float),
+            )
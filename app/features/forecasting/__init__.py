@@ -10,6 +10,7 @@ Exports:
         - SeasonalNaiveForecaster: Predicts value from same season
         - MovingAverageForecaster: Predicts mean of last N observations
         - model_factory: Create forecaster from config
+        - batch_forecast: Fit and forecast many series at once
 
     Schemas:
         - ModelConfig: Union of all model configurations
@@ -19,7 +20,7 @@ Exports:
 
     Persistence:
         - ModelBundle: Container for model + config + metadata
-        - save_model_bundle, load_model_bundle
+        - save_model_bundle, load_model_bundle, clear_model_bundle_cache
 
     Service:
         - ForecastingService: Orchestration layer for training/prediction
@@ -31,10 +32,12 @@ from app.features.forecasting.models import (
     MovingAverageForecaster,
     NaiveForecaster,
     SeasonalNaiveForecaster,
+    batch_forecast,
     model_factory,
 )
 from app.features.forecasting.persistence import (
     ModelBundle,
+    clear_model_bundle_cache,
     load_model_bundle,
     save_model_bundle,
 )
@@ -75,7 +78,9 @@ __all__ = [
     "SeasonalNaiveModelConfig",
     "TrainRequest",
     "TrainResponse",
+    "batch_forecast",
     # Persistence
+    "clear_model_bundle_cache",
     "load_model_bundle",
     "model_factory",
     "save_model_bundle",
@@ -12,14 +12,19 @@ CRITICAL: All implementations must be deterministic with fixed random_state.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import date as date_type
-from typing import TYPE_CHECKING, Any, Literal
+from typing import Any, Literal
 
 import numpy as np
 
-if TYPE_CHECKING:
-    from app.features.forecasting.schemas import ModelConfig
+from app.core.config import get_settings
+from app.features.forecasting.schemas import (
+    ModelConfig,
+    MovingAverageModelConfig,
+    SeasonalNaiveModelConfig,
+)
 
 
 @dataclass
@@ -125,6 +130,34 @@ class BaseForecaster(ABC):
             self (for method chaining).
         """
 
+    def _apply_params(self, params: dict[str, Any]) -> None:
+        """Set parameters after checking each name against get_params().
+
+        Changing a parameter on a fitted model clears the fitted state, since
+        state such as _last_values is sized by parameters like window_size or
+        season_length; the model must be refitted before predict.
+
+        Args:
+            params: Parameter names and values to set.
+
+        Raises:
+            ValueError: If a parameter name is not one of the model's parameters.
+        """
+        valid = self.get_params()
+        for key in params:
+            if key not in valid:
+                raise ValueError(
+                    f"Invalid parameter {key!r} for {type(self).__name__}. "
+                    f"Valid parameters: {sorted(valid)}"
+                )
+        changed = any(valid[key] != value for key, value in params.items())
+        for key, value in params.items():
+            setattr(self, key, value)
+        if changed and self._is_fitted:
+            self._is_fitted = False
+            self._last_values = None
+            self._fit_result = None
+
     @property
     def is_fitted(self) -> bool:
         """Check if the model has been fitted.
@@ -214,9 +247,11 @@ class NaiveForecaster(BaseForecaster):
 
         Returns:
             self (for method chaining).
+
+        Raises:
+            ValueError: If a parameter name is not one of the model's parameters.
         """
-        for key, value in params.items():
-            setattr(self, key, value)
+        self._apply_params(params)
         return self
 
 
@@ -294,12 +329,9 @@ class SeasonalNaiveForecaster(BaseForecaster):
             raise RuntimeError("Model must be fitted before predict")
         if self._last_values is None:
             raise RuntimeError("Model was not properly fitted")
-        # Cycle through seasonal values
-        forecasts = np.zeros(horizon, dtype=np.float64)
-        for h in range(horizon):
-            idx = h % self.season_length
-            forecasts[h] = self._last_values[idx]
-        return forecasts
+        # Cycle through seasonal values: np.resize repeats the stored season
+        # to fill the horizon, i.e. forecasts[h] = last_values[h % season_length]
+        return np.resize(self._last_values, horizon)
 
     def get_params(self) -> dict[str, Any]:
         """Get model parameters.
@@ -317,9 +349,11 @@ class SeasonalNaiveForecaster(BaseForecaster):
 
         Returns:
             self (for method chaining).
+
+        Raises:
+            ValueError: If a parameter name is not one of the model's parameters.
         """
-        for key, value in params.items():
-            setattr(self, key, value)
+        self._apply_params(params)
         return self
 
 
@@ -352,6 +386,24 @@ class MovingAverageForecaster(BaseForecaster):
             )
         self.window_size = window_size
         self._forecast_value: float = 0.0
+        self._running_sum: float = 0.0
+        self._ring_idx: int = 0
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore pickled state, rebuilding partial_fit state if it is missing.
+
+        Bundles saved before partial_fit existed have no running sum or ring
+        index. Their _last_values window is in chronological order, which is
+        the ring layout with the oldest entry at index 0.
+
+        Args:
+            state: Instance attributes from the pickle.
+        """
+        vars(self).update(state)
+        if "_running_sum" not in state:
+            last_values = state.get("_last_values")
+            self._running_sum = 0.0 if last_values is None else float(np.sum(last_values))
+            self._ring_idx = 0
 
     def fit(
         self,
@@ -372,12 +424,46 @@ class MovingAverageForecaster(BaseForecaster):
         """
         if len(y) < self.window_size:
             raise ValueError(f"Need at least {self.window_size} observations")
-        # Compute mean of last window_size values
+        # Compute mean of last window_size values from the running sum that
+        # partial_fit maintains (one reduction; same value as np.mean)
         self._last_values = np.array(y[-self.window_size :], dtype=np.float64)
-        self._forecast_value = float(np.mean(self._last_values))
+        self._running_sum = float(self._last_values.sum())
+        self._forecast_value = self._running_sum / self.window_size
+        self._ring_idx = 0
         self._is_fitted = True
         return self
 
+    def partial_fit(self, value: float) -> MovingAverageForecaster:
+        """Slide the window forward by one new observation in O(1).
+
+        Equivalent to refitting on the history extended by ``value``, for
+        walk-forward evaluation. _last_values is used as a ring buffer whose
+        oldest entry sits at _ring_idx; the running sum is recomputed exactly
+        each time the ring wraps so floating-point drift stays bounded.
+
+        Args:
+            value: Next observed value.
+
+        Returns:
+            self (for method chaining).
+
+        Raises:
+            RuntimeError: If model has not been fitted.
+        """
+        if not self._is_fitted or self._last_values is None:
+            raise RuntimeError("Model must be fitted before partial_fit")
+        # Step by the buffer actually held, not window_size, which may have
+        # been changed since fit
+        n = len(self._last_values)
+        value = float(value)
+        self._running_sum += value - float(self._last_values[self._ring_idx])
+        self._last_values[self._ring_idx] = value
+        self._ring_idx = (self._ring_idx + 1) % n
+        if self._ring_idx == 0:
+            self._running_sum = float(np.sum(self._last_values))
+        self._forecast_value = self._running_sum / n
+        return self
+
     def predict(
         self,
         horizon: int,
@@ -416,9 +502,11 @@ class MovingAverageForecaster(BaseForecaster):
 
         Returns:
             self (for method chaining).
+
+        Raises:
+            ValueError: If a parameter name is not one of the model's parameters.
         """
-        for key, value in params.items():
-            setattr(self, key, value)
+        self._apply_params(params)
         return self
 
 
@@ -426,6 +514,48 @@ class MovingAverageForecaster(BaseForecaster):
 ModelType = Literal["naive", "seasonal_naive", "moving_average", "lightgbm"]
 
 
+def _build_naive(config: ModelConfig, random_state: int) -> BaseForecaster:  # noqa: ARG001
+    """Build a NaiveForecaster."""
+    return NaiveForecaster(random_state=random_state)
+
+
+def _build_seasonal_naive(config: ModelConfig, random_state: int) -> BaseForecaster:
+    """Build a SeasonalNaiveForecaster from its config."""
+    if isinstance(config, SeasonalNaiveModelConfig):
+        return SeasonalNaiveForecaster(
+            season_length=config.season_length,
+            random_state=random_state,
+        )
+    raise ValueError("Invalid config type for seasonal_naive")
+
+
+def _build_moving_average(config: ModelConfig, random_state: int) -> BaseForecaster:
+    """Build a MovingAverageForecaster from its config."""
+    if isinstance(config, MovingAverageModelConfig):
+        return MovingAverageForecaster(
+            window_size=config.window_size,
+            random_state=random_state,
+        )
+    raise ValueError("Invalid config type for moving_average")
+
+
+def _build_lightgbm(config: ModelConfig, random_state: int) -> BaseForecaster:  # noqa: ARG001
+    """Build a LightGBM forecaster when the feature flag allows it."""
+    if not get_settings().forecast_enable_lightgbm:
+        raise ValueError("LightGBM is not enabled. Set forecast_enable_lightgbm=True in settings.")
+    # LightGBM implementation would go here when feature-flagged
+    raise NotImplementedError("LightGBM forecaster not yet implemented")
+
+
+# Builders keyed by model_type, resolved with one dict lookup per call
+_MODEL_BUILDERS: dict[str, Callable[[ModelConfig, int], BaseForecaster]] = {
+    "naive": _build_naive,
+    "seasonal_naive": _build_seasonal_naive,
+    "moving_average": _build_moving_average,
+    "lightgbm": _build_lightgbm,
+}
+
+
 def model_factory(config: ModelConfig, random_state: int = 42) -> BaseForecaster:
     """Create a forecaster instance from a configuration.
 
@@ -439,38 +569,57 @@ def model_factory(config: ModelConfig, random_state: int = 42) -> BaseForecaster
     Raises:
         ValueError: If model_type is unknown or LightGBM is not enabled.
     """
-    from app.core.config import get_settings
+    model_type: str = config.model_type
+    builder = _MODEL_BUILDERS.get(model_type)
+    if builder is None:
+        raise ValueError(f"Unknown model type: {model_type}")
+    return builder(config, random_state)
 
-    settings = get_settings()
 
-    model_type: str = config.model_type
+def batch_forecast(
+    y_matrix: np.ndarray[Any, np.dtype[np.floating[Any]]],
+    horizon: int,
+    config: ModelConfig,
+) -> np.ndarray[Any, np.dtype[np.floating[Any]]]:
+    """Fit and forecast many series at once for the baseline models.
 
-    if model_type == "naive":
-        return NaiveForecaster(random_state=random_state)
-    elif model_type == "seasonal_naive":
-        from app.features.forecasting.schemas import SeasonalNaiveModelConfig
+    Equivalent to fitting one forecaster per row and calling predict(horizon),
+    but computed with a few vectorized operations over the whole matrix.
 
-        if isinstance(config, SeasonalNaiveModelConfig):
-            return SeasonalNaiveForecaster(
-                season_length=config.season_length,
-                random_state=random_state,
-            )
-        raise ValueError("Invalid config type for seasonal_naive")
-    elif model_type == "moving_average":
-        from app.features.forecasting.schemas import MovingAverageModelConfig
-
-        if isinstance(config, MovingAverageModelConfig):
-            return MovingAverageForecaster(
-                window_size=config.window_size,
-                random_state=random_state,
-            )
-        raise ValueError("Invalid config type for moving_average")
-    elif model_type == "lightgbm":
-        if not settings.forecast_enable_lightgbm:
-            raise ValueError(
-                "LightGBM is not enabled. Set forecast_enable_lightgbm=True in settings."
-            )
-        # LightGBM implementation would go here when feature-flagged
-        raise NotImplementedError("LightGBM forecaster not yet implemented")
-    else:
-        raise ValueError(f"Unknown model type: {model_type}")
+    Args:
+        y_matrix: Target values, one series per row (2D array [n_series, n_time]).
+        horizon: Number of steps to forecast.
+        config: Model configuration (naive, seasonal_naive or moving_average).
+
+    Returns:
+        Array of forecasts with shape [n_series, horizon].
+
+    Raises:
+        ValueError: If y_matrix is not 2D, has too few observations, or the
+            model type has no batch implementation.
+    """
+    y = np.asarray(y_matrix, dtype=np.float64)
+    if y.ndim != 2:
+        raise ValueError(f"y_matrix must be 2D [n_series, n_time], got {y.ndim}D")
+    n_time = y.shape[1]
+
+    if config.model_type == "naive":
+        if n_time == 0:
+            raise ValueError("Cannot fit on empty array")
+        return np.repeat(y[:, -1:], horizon, axis=1)
+
+    if isinstance(config, SeasonalNaiveModelConfig):
+        season_length = config.season_length
+        if n_time < season_length:
+            raise ValueError(f"Need at least {season_length} observations")
+        # Same cycling as SeasonalNaiveForecaster: column h takes season value h % m
+        return y[:, -season_length:][:, np.arange(horizon) % season_length]
+
+    if isinstance(config, MovingAverageModelConfig):
+        window_size = config.window_size
+        if n_time < window_size:
+            raise ValueError(f"Need at least {window_size} observations")
+        means = y[:, -window_size:].mean(axis=1, keepdims=True)
+        return np.repeat(means, horizon, axis=1)
+
+    raise ValueError(f"Batch forecasting not supported for model type: {config.model_type}")
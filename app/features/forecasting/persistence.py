@@ -8,9 +8,12 @@ CRITICAL: Models saved with one Python/sklearn version may not load in another.
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
 import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -20,12 +23,18 @@ import joblib  # type: ignore[import-untyped]
 import sklearn  # type: ignore[import-untyped]
 import structlog
 
+from app.core.config import get_settings
+
 if TYPE_CHECKING:
     from app.features.forecasting.models import BaseForecaster
     from app.features.forecasting.schemas import ModelConfig
 
 logger = structlog.get_logger()
 
+# Loaded bundles keyed by (resolved path, mtime_ns, size) so a rewritten file misses
+_BUNDLE_CACHE: OrderedDict[tuple[str, int, int], ModelBundle] = OrderedDict()
+_BUNDLE_CACHE_LOCK = threading.Lock()
+
 
 @dataclass
 class ModelBundle:
@@ -117,6 +126,12 @@ def load_model_bundle(path: str | Path, base_dir: str | Path | None = None) -> M
     CRITICAL: Logs warning if versions don't match.
     SECURITY: Validates path is within allowed base directory to prevent path traversal.
 
+    Bundles are cached in-process (LRU, ``forecast_model_cache_size`` entries)
+    keyed by resolved path, modification time and size, so repeat predictions
+    against an unchanged artifact skip joblib.load. The cache holds a private
+    snapshot and every caller gets its own deep copy, so mutating a loaded
+    model (e.g. partial_fit) never leaks into later loads.
+
     Args:
         path: Path to saved bundle.
         base_dir: Optional base directory for path validation. If provided,
@@ -148,8 +163,25 @@ def load_model_bundle(path: str | Path, base_dir: str | Path | None = None) -> M
                 "Only model artifacts within the configured directory can be loaded."
             ) from None
 
-    if not path.exists():
-        raise FileNotFoundError(f"Model bundle not found: {path}")
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Model bundle not found: {path}") from None
+
+    cache_size = get_settings().forecast_model_cache_size
+    cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if cache_size > 0:
+        with _BUNDLE_CACHE_LOCK:
+            cached = _BUNDLE_CACHE.get(cache_key)
+            if cached is not None:
+                _BUNDLE_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            logger.debug(
+                "forecasting.model_bundle_cache_hit",
+                path=str(path),
+                bundle_hash=cached.bundle_hash,
+            )
+            return copy.deepcopy(cached)
 
     bundle: ModelBundle = joblib.load(path)  # pyright: ignore[reportUnknownMemberType]
 
@@ -178,4 +210,17 @@ def load_model_bundle(path: str | Path, base_dir: str | Path | None = None) -> M
         model_type=bundle.config.model_type,
     )
 
+    if cache_size > 0:
+        with _BUNDLE_CACHE_LOCK:
+            _BUNDLE_CACHE[cache_key] = copy.deepcopy(bundle)
+            _BUNDLE_CACHE.move_to_end(cache_key)
+            while len(_BUNDLE_CACHE) > cache_size:
+                _BUNDLE_CACHE.popitem(last=False)
+
     return bundle
+
+
+def clear_model_bundle_cache() -> None:
+    """Drop all bundles held by the load_model_bundle cache."""
+    with _BUNDLE_CACHE_LOCK:
+        _BUNDLE_CACHE.clear()
@@ -8,18 +8,19 @@ Model configs are designed to be:
 
 from __future__ import annotations
 
-import hashlib
 from datetime import date as date_type
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from app.shared.schemas import ConfigHashMixin
+
 # =============================================================================
 # Model Configuration Schemas
 # =============================================================================
 
 
-class ModelConfigBase(BaseModel):
+class ModelConfigBase(ConfigHashMixin):
     """Base configuration for all forecasting models.
 
     All model configs inherit from this base to ensure:
@@ -39,15 +40,6 @@ class ModelConfigBase(BaseModel):
         pattern=r"^\d+\.\d+(\.\d+)?$",
     )
 
-    def config_hash(self) -> str:
-        """Generate deterministic hash of configuration.
-
-        Returns:
-            16-character hex string hash of config JSON.
-        """
-        config_json = self.model_dump_json()
-        return hashlib.sha256(config_json.encode()).hexdigest()[:16]
-
 
 class NaiveModelConfig(ModelConfigBase):
     """Configuration for naive forecaster (last value).
@@ -1,5 +1,6 @@
 """Tests for forecasting models."""
 
+import joblib  # type: ignore[import-untyped]
 import numpy as np
 import pytest
 
@@ -7,6 +8,7 @@ from app.features.forecasting.models import (
     MovingAverageForecaster,
     NaiveForecaster,
     SeasonalNaiveForecaster,
+    batch_forecast,
     model_factory,
 )
 
@@ -74,6 +76,15 @@ class TestNaiveForecaster:
 
         assert model.random_state == 99
 
+    def test_set_params_rejects_unknown_parameter(self):
+        """Misspelled parameters should raise instead of adding attributes."""
+        model = NaiveForecaster()
+
+        with pytest.raises(ValueError, match="Invalid parameter 'random_seed'"):
+            model.set_params(random_seed=1)
+
+        assert not hasattr(model, "random_seed")
+
 
 class TestSeasonalNaiveForecaster:
     """Tests for SeasonalNaiveForecaster."""
@@ -109,6 +120,19 @@ class TestSeasonalNaiveForecaster:
         expected = np.array([10.0, 20.0, 30.0])
         np.testing.assert_array_equal(forecasts, expected)
 
+    @pytest.mark.parametrize("horizon", [0, 1, 7, 100])
+    def test_predict_matches_modular_index(self, sample_seasonal_series, horizon):
+        """Forecast h should be the stored season value at h % season_length."""
+        model = SeasonalNaiveForecaster(season_length=7)
+        model.fit(sample_seasonal_series)
+
+        forecasts = model.predict(horizon=horizon)
+
+        season = sample_seasonal_series[-7:]
+        expected = np.array([season[h % 7] for h in range(horizon)], dtype=np.float64)
+        assert forecasts.dtype == np.float64
+        np.testing.assert_array_equal(forecasts, expected)
+
     def test_insufficient_data_raises(self):
         """Test that insufficient data raises ValueError."""
         model = SeasonalNaiveForecaster(season_length=7)
@@ -139,6 +163,24 @@ class TestSeasonalNaiveForecaster:
 
         assert model.season_length == 30
 
+    def test_set_params_season_change_clears_fit(self, sample_seasonal_series):
+        """A new season_length must not keep predicting the old fitted season."""
+        model = SeasonalNaiveForecaster(season_length=7).fit(sample_seasonal_series)
+
+        model.set_params(season_length=14)
+
+        assert not model.is_fitted
+        with pytest.raises(RuntimeError, match="fitted"):
+            model.predict(3)
+
+    def test_set_params_same_value_keeps_fit(self, sample_seasonal_series):
+        """Re-setting an unchanged parameter should leave the model fitted."""
+        model = SeasonalNaiveForecaster(season_length=7).fit(sample_seasonal_series)
+
+        model.set_params(season_length=7)
+
+        assert model.is_fitted
+
 
 class TestMovingAverageForecaster:
     """Tests for MovingAverageForecaster."""
@@ -196,6 +238,58 @@ class TestMovingAverageForecaster:
 
         assert params == {"window_size": 14, "random_state": 42}
 
+    def test_partial_fit_matches_refit(self):
+        """Sliding the window one value at a time should equal refitting."""
+        rng = np.random.default_rng(0)
+        history = rng.uniform(0, 100, size=60)
+        model = MovingAverageForecaster(window_size=7).fit(history[:20])
+
+        for t in range(20, len(history)):
+            model.partial_fit(history[t])
+            refit = MovingAverageForecaster(window_size=7).fit(history[: t + 1])
+            assert model.predict(3) == pytest.approx(refit.predict(3))
+
+    def test_partial_fit_on_model_pickled_before_ring_buffer(self, tmp_path):
+        """Unpickled models without running-sum state should rebuild it lazily."""
+        rng = np.random.default_rng(1)
+        history = rng.uniform(0, 100, size=40)
+        model = MovingAverageForecaster(window_size=7).fit(history[:20])
+        # Simulate a bundle saved before partial_fit added these attributes
+        del model.__dict__["_running_sum"], model.__dict__["_ring_idx"]
+
+        joblib.dump(model, tmp_path / "model.joblib")
+        restored = joblib.load(tmp_path / "model.joblib")
+        for t in range(20, len(history)):
+            restored.partial_fit(history[t])
+
+        refit = MovingAverageForecaster(window_size=7).fit(history)
+        assert restored.predict(3) == pytest.approx(refit.predict(3))
+
+    @pytest.mark.parametrize("new_window", [1, 5])
+    def test_set_params_window_change_requires_refit(self, new_window):
+        """Changing window_size after fit should clear the stale fitted window."""
+        model = MovingAverageForecaster(window_size=3).fit(np.array([1.0, 2.0, 3.0]))
+        model.set_params(window_size=new_window)
+
+        assert not model.is_fitted
+        with pytest.raises(RuntimeError, match="fitted"):
+            model.partial_fit(4.0)
+
+    def test_partial_fit_steps_by_fitted_buffer(self):
+        """partial_fit should follow the held window even if window_size drifts."""
+        model = MovingAverageForecaster(window_size=3).fit(np.array([1.0, 2.0, 3.0]))
+        model.window_size = 5
+
+        for value in (4.0, 5.0, 6.0, 7.0):
+            model.partial_fit(value)
+
+        assert model.predict(1)[0] == pytest.approx(6.0)
+
+    def test_partial_fit_before_fit_raises(self):
+        """partial_fit needs an initial window from fit."""
+        with pytest.raises(RuntimeError, match="fitted"):
+            MovingAverageForecaster(window_size=7).partial_fit(1.0)
+
 
 class TestModelFactory:
     """Tests for model_factory function."""
@@ -221,6 +315,44 @@ class TestModelFactory:
         assert isinstance(model, MovingAverageForecaster)
         assert model.window_size == 7
 
+    def test_factory_rejects_unknown_model_type(self, sample_naive_config):
+        """Unknown model types should raise ValueError."""
+        config = sample_naive_config.model_copy(update={"model_type": "prophet"})
+
+        with pytest.raises(ValueError, match="Unknown model type: prophet"):
+            model_factory(config)
+
+
+class TestBatchForecast:
+    """Tests for batch_forecast over a matrix of series."""
+
+    @pytest.mark.parametrize(
+        "config_fixture", ["sample_naive_config", "sample_seasonal_config", "sample_mavg_config"]
+    )
+    @pytest.mark.parametrize("horizon", [1, 10])
+    def test_matches_per_series_forecasters(self, request, config_fixture, horizon):
+        """Each row should equal fitting and predicting that series on its own."""
+        config = request.getfixturevalue(config_fixture)
+        rng = np.random.default_rng(0)
+        y_matrix = rng.uniform(0, 100, size=(5, 30))
+
+        forecasts = batch_forecast(y_matrix, horizon, config)
+
+        assert forecasts.shape == (5, horizon)
+        for row, series in zip(forecasts, y_matrix, strict=True):
+            expected = model_factory(config).fit(series).predict(horizon)
+            np.testing.assert_allclose(row, expected)
+
+    def test_rejects_non_2d_input(self, sample_naive_config):
+        """A single series must be passed as a one-row matrix."""
+        with pytest.raises(ValueError, match="must be 2D"):
+            batch_forecast(np.arange(10, dtype=np.float64), 3, sample_naive_config)
+
+    def test_insufficient_data_raises(self, sample_seasonal_config):
+        """Fewer observations than the season should raise like fit does."""
+        with pytest.raises(ValueError, match="Need at least 7 observations"):
+            batch_forecast(np.ones((2, 5)), 3, sample_seasonal_config)
+
 
 class TestBaseForecasterInterface:
     """Tests for BaseForecaster interface compliance."""
@@ -3,12 +3,20 @@
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import joblib  # type: ignore[import-untyped]
 import numpy as np
 import pytest
 
-from app.features.forecasting.models import NaiveForecaster, SeasonalNaiveForecaster
+from app.core.config import Settings
+from app.features.forecasting import persistence
+from app.features.forecasting.models import (
+    MovingAverageForecaster,
+    NaiveForecaster,
+    SeasonalNaiveForecaster,
+)
 from app.features.forecasting.persistence import (
     ModelBundle,
+    clear_model_bundle_cache,
     load_model_bundle,
     save_model_bundle,
 )
@@ -215,3 +223,119 @@ class TestSaveLoadBundle:
         loaded_bundle = load_model_bundle(tmp_model_path + ".joblib")
 
         assert loaded_bundle.bundle_hash == original_hash
+
+
+class TestModelBundleCache:
+    """Tests for the in-process load_model_bundle cache."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        clear_model_bundle_cache()
+        yield
+        clear_model_bundle_cache()
+
+    @pytest.fixture
+    def load_calls(self, monkeypatch):
+        """Count joblib.load calls made by load_model_bundle."""
+        calls: list[Path] = []
+        real_load = joblib.load
+
+        def counting_load(path):
+            calls.append(path)
+            return real_load(path)
+
+        monkeypatch.setattr(joblib, "load", counting_load)
+        return calls
+
+    @staticmethod
+    def _save(config, series, path) -> Path:
+        model = NaiveForecaster()
+        model.fit(series)
+        return save_model_bundle(ModelBundle(model=model, config=config), path)
+
+    def test_repeat_load_skips_deserialization(
+        self, load_calls, sample_naive_config, sample_time_series, tmp_model_path
+    ):
+        """Test that loading an unchanged file twice reads it from disk once."""
+        saved_path = self._save(sample_naive_config, sample_time_series, tmp_model_path)
+
+        first = load_model_bundle(saved_path)
+        second = load_model_bundle(saved_path)
+
+        assert len(load_calls) == 1
+        assert second.bundle_hash == first.bundle_hash
+
+    def test_mutating_loaded_bundle_does_not_affect_next_load(
+        self, load_calls, sample_mavg_config, sample_time_series, tmp_model_path
+    ):
+        """Test that each load returns an independent copy of the cached bundle."""
+        model = MovingAverageForecaster(window_size=7).fit(sample_time_series)
+        expected = model.predict(horizon=1)
+        saved_path = save_model_bundle(
+            ModelBundle(model=model, config=sample_mavg_config), tmp_model_path
+        )
+
+        for _ in range(2):
+            loaded = load_model_bundle(saved_path)
+            assert isinstance(loaded.model, MovingAverageForecaster)
+            loaded.model.partial_fit(1_000.0)
+            loaded.metadata["touched"] = True
+
+        reloaded = load_model_bundle(saved_path)
+
+        assert len(load_calls) == 1
+        np.testing.assert_array_equal(reloaded.model.predict(horizon=1), expected)
+        assert "touched" not in reloaded.metadata
+
+    def test_rewritten_file_is_reloaded(
+        self, load_calls, sample_naive_config, sample_time_series, tmp_model_path
+    ):
+        """Test that a changed file invalidates the cached entry."""
+        saved_path = self._save(sample_naive_config, sample_time_series, tmp_model_path)
+        load_model_bundle(saved_path)
+
+        self._save(sample_naive_config, sample_time_series + 100.0, tmp_model_path)
+        second = load_model_bundle(saved_path)
+
+        assert len(load_calls) == 2
+        assert second.model.predict(horizon=1)[0] == sample_time_series[-1] + 100.0
+
+    def test_cache_evicts_least_recently_used(
+        self, monkeypatch, load_calls, sample_naive_config, sample_time_series, tmp_model_path
+    ):
+        """Test that the cache holds at most forecast_model_cache_size bundles."""
+        monkeypatch.setattr(
+            persistence, "get_settings", lambda: Settings(forecast_model_cache_size=1)
+        )
+        path_a = self._save(sample_naive_config, sample_time_series, tmp_model_path + "_a")
+        path_b = self._save(sample_naive_config, sample_time_series, tmp_model_path + "_b")
+
+        load_model_bundle(path_a)
+        load_model_bundle(path_b)
+        load_model_bundle(path_a)
+
+        assert len(load_calls) == 3
+
+    def test_cache_disabled_with_zero_size(
+        self, monkeypatch, load_calls, sample_naive_config, sample_time_series, tmp_model_path
+    ):
+        """Test that a cache size of zero always reloads from disk."""
+        monkeypatch.setattr(
+            persistence, "get_settings", lambda: Settings(forecast_model_cache_size=0)
+        )
+        saved_path = self._save(sample_naive_config, sample_time_series, tmp_model_path)
+
+        load_model_bundle(saved_path)
+        load_model_bundle(saved_path)
+
+        assert len(load_calls) == 2
+
+    def test_base_dir_checked_before_cache(
+        self, sample_naive_config, sample_time_series, tmp_model_path
+    ):
+        """Test that a cached bundle is still rejected outside base_dir."""
+        saved_path = self._save(sample_naive_config, sample_time_series, tmp_model_path)
+        load_model_bundle(saved_path)
+
+        with TemporaryDirectory() as other_dir, pytest.raises(ValueError, match="outside"):
+            load_model_bundle(saved_path, base_dir=other_dir)
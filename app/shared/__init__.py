@@ -1,9 +1,10 @@
 """Shared utilities used across 3+ features."""
 
 from app.shared.models import TimestampMixin
-from app.shared.schemas import ErrorResponse, PaginatedResponse, PaginationParams
+from app.shared.schemas import ConfigHashMixin, ErrorResponse, PaginatedResponse, PaginationParams
 
 __all__ = [
+    "ConfigHashMixin",
     "ErrorResponse",
     "PaginatedResponse",
     "PaginationParams",
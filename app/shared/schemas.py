@@ -1,7 +1,14 @@
-"""Shared Pydantic schemas for API responses."""
+"""Shared Pydantic schemas for API responses and versioned configs."""
+
+import hashlib
+from collections.abc import Mapping
+from typing import Any, Self
 
 from pydantic import BaseModel, Field
 
+# Instance __dict__ key holding the memoized config_hash() digest
+_CONFIG_HASH_KEY = "_cached_config_hash"
+
 
 class ErrorDetail(BaseModel):
     """Detailed error information."""
@@ -46,3 +53,32 @@ class PaginatedResponse[T](BaseModel):
     page: int = Field(..., ge=1, description="Current page number")
     page_size: int = Field(..., ge=1, description="Items per page")
     pages: int = Field(..., ge=0, description="Total number of pages")
+
+
+class ConfigHashMixin(BaseModel):
+    """Adds a memoized deterministic ``config_hash()`` to frozen config models."""
+
+    def config_hash(self) -> str:
+        """Generate deterministic hash of configuration.
+
+        The digest is computed on first call and cached in the instance
+        ``__dict__`` (like ``functools.cached_property``), which frozen models
+        allow and which pydantic ignores for equality and serialization.
+
+        Returns:
+            16-character hex string hash of config JSON.
+        """
+        cached: str | None = vars(self).get(_CONFIG_HASH_KEY)
+        if cached is None:
+            # Serialize straight to bytes (same output as model_dump_json()),
+            # skipping the bytes -> str -> bytes round-trip
+            config_json = self.__pydantic_serializer__.to_json(self)
+            cached = hashlib.sha256(config_json).hexdigest()[:16]
+            vars(self)[_CONFIG_HASH_KEY] = cached
+        return cached
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the config, dropping the cached hash so it is recomputed."""
+        copied = super().model_copy(update=update, deep=deep)
+        vars(copied).pop(_CONFIG_HASH_KEY, None)
+        return copied
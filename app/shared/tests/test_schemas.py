@@ -0,0 +1,54 @@
+"""Tests for shared Pydantic schemas."""
+
+import hashlib
+
+from pydantic import ConfigDict
+
+from app.features.featuresets.schemas import FeatureConfigBase
+from app.features.forecasting.schemas import ModelConfigBase
+from app.shared.schemas import ConfigHashMixin
+
+
+class _Config(ConfigHashMixin):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    name: str = "test"
+    window: int = 7
+
+
+class TestConfigHashMixin:
+    """Tests for the memoized config_hash() mixin."""
+
+    def test_config_hash_is_truncated_sha256_of_json(self):
+        """config_hash should be a truncated SHA-256 of the model JSON."""
+        config = _Config()
+
+        expected = hashlib.sha256(config.model_dump_json().encode()).hexdigest()[:16]
+
+        assert config.config_hash() == expected
+
+    def test_config_hash_cached_without_affecting_equality(self):
+        """Cached hash should be reused and not change equality or dumps."""
+        config1 = _Config()
+        config2 = _Config()
+
+        first = config1.config_hash()
+
+        assert config1.config_hash() is first
+        assert config1 == config2
+        assert config1.model_dump() == config2.model_dump()
+
+    def test_config_hash_recomputed_after_model_copy(self):
+        """model_copy with updates should not reuse the stale cached hash."""
+        config = _Config()
+        original = config.config_hash()
+
+        copied = config.model_copy(update={"window": 14})
+
+        assert copied.config_hash() != original
+        assert copied.config_hash() == _Config(window=14).config_hash()
+
+    def test_feature_and_model_configs_share_mixin(self):
+        """Feature and model config bases should both use the shared mixin."""
+        assert issubclass(FeatureConfigBase, ConfigHashMixin)
+        assert issubclass(ModelConfigBase, ConfigHashMixin)